@@ -60,14 +60,16 @@ squares = []
 for num in numbers:
     squares.append(num ** 2)
 
-print(squares)  # <- Output: [1, 4, 9, 16, 25]
+if __name__ == "__main__":  # only when run as a script, importing stays silent (see 08_a_polite_suggestion.py)
+    print(squares)  # <- Output: [1, 4, 9, 16, 25]
 
 # __Pythonic Example__:
 # Instead of manually appending to a list, Python provides an elegant solution using list comprehensions.
 
 squares = [num ** 2 for num in numbers]
 
-print(squares)  # <- Output: [1, 4, 9, 16, 25]
+if __name__ == "__main__":
+    print(squares)  # <- Output: [1, 4, 9, 16, 25]
 
 # ^ more concise, readable, efficient etc..
 
@@ -31,19 +31,137 @@ def do_other_thing(
 # --------------------------------------------------------
 # 📌 Method Chaining & Hanging Dots
 # --------------------------------------------------------
+# Each call in the chain returns a *new* query, so a half-built query can be reused safely.
+# Nothing touches the data until .all() — the chain only describes what we want (a "query plan").
+
+import itertools
+from collections import OrderedDict, namedtuple
+
+_MISSING = object()  # a record without the field never matches
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions", "invalidations", "maxsize", "currsize"])
+
+def _matches(record, filters):
+    return all(record.get(field, _MISSING) == value for field, value in filters)
+
 class MockQuery:
+    def __init__(self, db, filters=(), limit=None):
+        self._db = db
+        self._filters = filters
+        self._limit = limit
+
     def filter_by(self, **kwargs):
-        return self
+        return MockQuery(self._db, self._filters + tuple(kwargs.items()), self._limit)
+
     def limit(self, n):
-        return self
+        return MockQuery(self._db, self._filters, n)
+
     def all(self):
-        return ["result"]
+        # copies: editing a result mustn't change the store behind its index's and cache's back
+        return [dict(record) for record in self._db._cached_run(self)]
+
+    def _plan_key(self):
+        # filter_by(a=1, b=2) and filter_by(b=2).filter_by(a=1) are the same query
+        filters = sorted(set(self._filters), key=lambda item: (item[0], repr(item[1])))
+        return tuple(filters), self._limit
+
+    def _run(self):
+        return list(itertools.islice(self._scan(), self._limit))  # islice stops the scan early
+
+    def _scan(self):
+        """Yield matching records lazily, in insertion order."""
+        db = self._db
+        # Start from the smallest index bucket we can use, otherwise scan every row
+        candidates = None
+        for field, value in self._filters:
+            index = db._indexes.get(field)
+            if index is not None:
+                try:
+                    bucket = index.get(value, ())
+                except TypeError:
+                    continue  # an unhashable value (a list ...) can't be looked up: the scan checks it instead
+                if candidates is None or len(bucket) < len(candidates):
+                    candidates = bucket
+        rows = range(len(db._records)) if candidates is None else candidates
+
+        for row in rows:
+            record = db._records[row]
+            if _matches(record, self._filters):
+                yield record
 
 class MockDB:
+    """A tiny in-memory record store with hash indexes on the fields you declare.
+
+    Query results are kept in a bounded LRU cache (cache_size=0 turns it off).
+    Always change data through insert() — that's how the cache knows what went stale.
+    Records are copied in and out, so editing a dict you inserted or got back never changes the store.
+    """
+
+    def __init__(self, records=(), *, indexes=(), cache_size=128):
+        self._records = []
+        self._indexes = {field: {} for field in indexes}  # field -> value -> row numbers
+        self._cache = OrderedDict()  # plan key -> result, least recently used first
+        self._cache_size = cache_size
+        self._hits = self._misses = self._evictions = self._invalidations = 0
+        for record in records:
+            self.insert(record)
+
+    def insert(self, record):
+        row = len(self._records)
+        record = dict(record)
+        self._records.append(record)
+        for field, index in self._indexes.items():
+            if field in record:
+                try:
+                    index.setdefault(record[field], []).append(row)
+                except TypeError:
+                    pass  # unhashable: not indexed, queries for it fall back to scanning
+
+        # Only drop results the new record would actually show up in:
+        # it has to match the filters, and a full limit()-ed result never reaches the new (last) row.
+        for key, result in list(self._cache.items()):
+            filters, limit = key
+            if _matches(record, filters) and (limit is None or len(result) < limit):
+                del self._cache[key]
+                self._invalidations += 1
+
+    def cache_info(self):
+        """Cache counters, in the spirit of functools.lru_cache().cache_info()."""
+        return CacheInfo(self._hits, self._misses, self._evictions, self._invalidations,
+                         self._cache_size, len(self._cache))
+
+    def _cached_run(self, query):
+        try:
+            key = query._plan_key()
+            hash(key)
+        except TypeError:
+            return query._run()  # unhashable filter values can't be cached
+
+        if key in self._cache:
+            self._hits += 1
+            self._cache.move_to_end(key)
+            return self._cache[key]  # all() copies the records, and with them the list
+
+        self._misses += 1
+        result = query._run()
+        if self._cache_size > 0:
+            self._cache[key] = result
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+                self._evictions += 1
+        return result
+
     def query(self):
-        return MockQuery()
+        return MockQuery(self)
 
-db = MockDB()
+db = MockDB(
+    [
+        {"id": 1, "name": "Adrian", "active": True},
+        {"id": 2, "name": "Aden", "active": False},
+        {"id": 3, "name": "Romeo", "active": True},
+    ],
+    indexes=["active"],
+)
 
 # Standard style:
 results = db.query().filter_by(active=True).limit(5).all()
@@ -79,9 +197,63 @@ numbers = [
 # --------------------------------------------------------
 # 🔗 Chaining Context Managers
 # --------------------------------------------------------
-with open("a.txt") as fa, \
-     open("b.txt") as fb:
-    data = fa.read() + fb.read()
+import os
+
+# Only when run as a script (importing stays silent, see 08_a_polite_suggestion.py), and only if the files exist
+if __name__ == "__main__" and os.path.exists("a.txt") and os.path.exists("b.txt"):
+    with open("a.txt") as fa, \
+         open("b.txt") as fb:
+        data = fa.read() + fb.read()
+
+# ^ fine for small files, but .read() + .read() holds both files *and* the joined copy in memory
+#      (roughly 2x their combined size at peak).
+
+# When we only want the files glued together on disk, the data doesn't need to pass through Python at all:
+#      os.copy_file_range() / os.sendfile() let the kernel copy straight from one file to another.
+#      Where that isn't available (other OS, odd file systems) we stream fixed-size chunks instead.
+
+import errno
+import sys
+
+_KERNEL_COPY_UNSUPPORTED = {errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EBADF, errno.ENOTSUP, errno.EOPNOTSUPP}
+
+def _kernel_copy(src_fd, dst_fd, chunk_size):
+    """Copy the rest of src_fd to dst_fd in the kernel. Returns False if it isn't supported here."""
+    copiers = []
+    if hasattr(os, "copy_file_range"):
+        copiers.append(lambda: os.copy_file_range(src_fd, dst_fd, chunk_size))
+    if hasattr(os, "sendfile") and sys.platform.startswith("linux"):  # file -> file only works on Linux
+        copiers.append(lambda: os.sendfile(dst_fd, src_fd, None, chunk_size))
+
+    for copy in copiers:
+        copied = 0
+        try:
+            while (sent := copy()) > 0:
+                copied += sent
+        except OSError as error:
+            if copied == 0 and error.errno in _KERNEL_COPY_UNSUPPORTED:
+                continue  # try the next way of copying
+            raise
+        return True
+    return False
+
+def _chunked_copy(src, dst, chunk_size):
+    buffer = bytearray(chunk_size)  # one reusable buffer, no new bytes object per chunk
+    view = memoryview(buffer)
+    while (size := src.readinto(buffer)) > 0:
+        written = 0
+        while written < size:
+            written += dst.write(view[written:size])
+
+def concat_files(destination, *sources, chunk_size=1024 * 1024):
+    """Write all sources, one after another, into destination without loading them into memory."""
+    with open(destination, "wb", buffering=0) as dst:
+        for source in sources:
+            with open(source, "rb", buffering=0) as src:
+                if not _kernel_copy(src.fileno(), dst.fileno(), chunk_size):
+                    _chunked_copy(src, dst, chunk_size)
+
+# concat_files("ab.txt", "a.txt", "b.txt")  # any number of inputs, flat memory use
 
 # --------------------------------------------------------
 # 🧠 Zen of Python Reminder
@@ -94,3 +266,100 @@ with open("a.txt") as fa, \
 # - Use these advanced formatting tricks judiciously. <-- use it well-judging
 # - Always prioritize clarity for others
 # - Break rules when it makes code more readable.
+
+# --------------------------------------------------------
+# ⏱️ Measuring the query engine
+# --------------------------------------------------------
+
+def benchmark_query(rows=1_000_000):
+    import time
+
+    big_db = MockDB(
+        ({"id": i, "active": i % 2 == 0, "team": i % 100} for i in range(rows)),
+        indexes=["active"],
+    )
+    plans = {
+        "indexed filter_by(active=True).limit(5)": big_db.query().filter_by(active=True).limit(5),
+        "unindexed filter_by(team=7).limit(5)": big_db.query().filter_by(team=7).limit(5),
+        "unindexed filter_by(team=-1) (full scan)": big_db.query().filter_by(team=-1),
+    }
+    for label, plan in plans.items():
+        start = time.perf_counter()
+        plan.all()
+        cold = time.perf_counter() - start
+        start = time.perf_counter()
+        plan.all()
+        cached = time.perf_counter() - start
+        print(f"{label:<42} {cold * 1e6:>12,.1f} µs   cached {cached * 1e6:>6,.1f} µs  ({rows:,} rows)")
+    print(big_db.cache_info())
+
+    # Unhashable values can't use (or be put in) an index, they're found by scanning instead
+    tags_db = MockDB([{"tags": ["a"]}, {"tags": "a"}], indexes=["tags"])
+    assert tags_db.query().filter_by(tags=["a"]).all() == [{"tags": ["a"]}]
+
+    # Results are copies: changing one doesn't sneak a non-matching row into the store (or the cache)
+    small_db = MockDB([{"a": 1, "b": 2}], indexes=["b"])
+    small_db.query().filter_by(b=2).all()[0]["b"] = 99
+    assert small_db.query().filter_by(b=2).all() == [{"a": 1, "b": 2}]
+    assert small_db.query().filter_by(b=99).all() == []
+
+# --------------------------------------------------------
+# Only runs when this file is run as a script (see 08_a_polite_suggestion.py)
+# --------------------------------------------------------
+
+def _measure_concat(concat, destination, sources, results):
+    import resource  # Unix only
+    import time
+
+    start = time.perf_counter()
+    concat(destination, *sources)
+    elapsed = time.perf_counter() - start
+    # ru_maxrss is in KiB on Linux (bytes on macOS)
+    results.put((elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss))
+
+def _concat_with_read(destination, *sources):
+    data = b""
+    for source in sources:
+        with open(source, "rb") as file:
+            data = data + file.read()  # ❌ the pattern from above
+    with open(destination, "wb") as out:
+        out.write(data)
+
+def _concat_chunked(destination, *sources, chunk_size=1024 * 1024):
+    with open(destination, "wb", buffering=0) as dst:
+        for source in sources:
+            with open(source, "rb", buffering=0) as src:
+                _chunked_copy(src, dst, chunk_size)
+
+def benchmark_concat(total_size=1024 ** 3, parts=2):
+    import multiprocessing
+    import tempfile
+
+    # Peak RSS only ever goes up within a process, so each variant gets its own child process.
+    with tempfile.TemporaryDirectory() as folder:
+        sources = []
+        block = os.urandom(1024 * 1024)
+        for part in range(parts):
+            sources.append(os.path.join(folder, f"part{part}.bin"))
+            with open(sources[-1], "wb") as file:
+                for _ in range(total_size // parts // len(block)):
+                    file.write(block)
+
+        destination = os.path.join(folder, "joined.bin")
+        variants = {
+            "read() + read()": _concat_with_read,
+            "chunked copy": _concat_chunked,
+            "concat_files (kernel copy)": concat_files,
+        }
+        for label, concat in variants.items():
+            results = multiprocessing.Queue()
+            worker = multiprocessing.Process(target=_measure_concat, args=(concat, destination, sources, results))
+            worker.start()
+            elapsed, peak_rss = results.get()
+            worker.join()
+            assert os.path.getsize(destination) == sum(map(os.path.getsize, sources))
+            print(f"{label:<28} {elapsed:7.3f}s   peak RSS {peak_rss:>10,} KiB   ({total_size / 1024 ** 3:.1f} GiB)")
+
+if __name__ == "__main__":
+    benchmark_query()
+    benchmark_concat()
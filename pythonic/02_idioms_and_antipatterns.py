@@ -16,12 +16,14 @@
 fruits = ["apple", "banana", "cherry"]
 
 # ❌ Un-Pythonic:
-for i in range(len(fruits)):
-    print(i, fruits[i])
+if __name__ == "__main__":  # only when run as a script, importing stays silent (see 08_a_polite_suggestion.py)
+    for i in range(len(fruits)):
+        print(i, fruits[i])
 
 # ✅ Pythonic:
-for i, fruit in enumerate(fruits):
-    print(i, fruit)
+if __name__ == "__main__":
+    for i, fruit in enumerate(fruits):
+        print(i, fruit)
 
 # enumerate() gives us both index and value, more clearly and safely.
 
@@ -32,12 +34,14 @@ for i, fruit in enumerate(fruits):
 # --------------------------------------------------------
 
 # ❌
-if len(fruits) > 0:
-    print("we have fruits!!")
+if __name__ == "__main__":
+    if len(fruits) > 0:
+        print("we have fruits!!")
 
 # ✅
-if fruits:
-    print("we have fruits!!")
+if __name__ == "__main__":
+    if fruits:
+        print("we have fruits!!")
 
 # Empty containers evaluate to False in Python <-- clean & expressive
 
@@ -107,6 +111,65 @@ message = messages.get(status, "N/A")
 
 # simply way better ( subjective, but i don't see an argument that would speak against it) __<-- it's cleaner, gives a faster lookup & is easier to extend / maintain.
 
+# --------------------------------------------------------
+# ⚡ Going Further: Lookup Tables for Millions of Codes
+# --------------------------------------------------------
+
+# When the keys are small non-negative integers (status codes, opcodes, enum values ...),
+#      a plain list indexed by the code is even cheaper than hashing: table[404].
+# And translating a whole batch in one map() call keeps the loop in C instead of Python.
+
+import itertools
+from collections.abc import Sequence
+
+class CodeTable:
+    """Translate integer codes into values, one at a time or a whole batch at once.
+
+    Uses a list indexed by code when every key is an int in range(max_size),
+    and falls back to a plain dict otherwise.
+    """
+
+    def __init__(self, mapping, default=None, *, max_size=65536):
+        self.default = default
+        self._dict = dict(mapping)
+        keys = self._dict.keys()
+        if keys and all(type(key) is int for key in keys) and min(keys) >= 0 and max(keys) < max_size:
+            self._table = [default] * (max(keys) + 1)
+            for key, value in self._dict.items():
+                self._table[key] = value
+        else:
+            self._table = None
+
+    @property
+    def dense(self):
+        return self._table is not None
+
+    def get(self, code):
+        table = self._table
+        if table is not None and type(code) is int and 0 <= code < len(table):
+            return table[code]
+        return self._dict.get(code, self.default)
+
+    def translate(self, codes):
+        """Look up every code in a list/tuple/array (or any iterable) and return a list."""
+        if self._table is not None:
+            if not isinstance(codes, Sequence) and not hasattr(codes, "__len__"):
+                codes = list(codes)  # we need two passes over it
+            try:
+                # negative indexes would silently wrap around (unsigned arrays can't hold any)
+                if getattr(codes, "typecode", "b") in "BHILQ" or min(codes) >= 0:
+                    return list(map(self._table.__getitem__, codes))
+            except (ValueError, IndexError, TypeError):
+                pass  # empty, out of range or not an int: let the dict sort it out
+        return list(map(self._dict.get, codes, itertools.repeat(self.default)))
+
+status_messages = CodeTable(messages, default="N/A")
+message = status_messages.get(status)                        # "Not Found"
+batch = status_messages.translate([200, 500, 404, 418])     # ['OK', 'Server Error', 'Not Found', 'N/A']
+
+# ^ one code at a time, messages.get() is still the one to use — a Python-level method call costs more
+#      than the hash lookup it saves. The table pays off in translate(), on big batches (run this file to see).
+
 
 # --------------------------------------------------------
 # Summary
@@ -116,3 +179,44 @@ message = messages.get(status, "N/A")
 # - Use built-in functions and patterns
 # - Prefer clarity over cleverness
 # - Avoid reinventing what's already elegant in the language
+
+# --------------------------------------------------------
+# ⏱️ Measuring it: if-chain vs dict vs table
+# --------------------------------------------------------
+
+def _message_from_if_chain(status):
+    if status == 200:
+        return "OK"
+    elif status == 404:
+        return "Not Found"
+    elif status == 500:
+        return "Server Error"
+    return "N/A"
+
+def benchmark_status_lookup(count=1_000_000):
+    import random
+    import time
+    from array import array
+
+    codes = array("H", random.choices([200, 404, 500, 302], k=count))
+    lookup = messages.get
+    table = CodeTable(messages, default="N/A")
+    variants = {
+        "if/elif chain": lambda: [_message_from_if_chain(code) for code in codes],
+        "dict.get per code": lambda: [lookup(code, "N/A") for code in codes],
+        "CodeTable.get per code": lambda: [table.get(code) for code in codes],
+        "dict.get via map()": lambda: list(map(lookup, codes, itertools.repeat("N/A"))),
+        "CodeTable.translate": lambda: table.translate(codes),
+    }
+    expected = variants["if/elif chain"]()
+    for label, run in variants.items():
+        assert run() == expected
+        best = float("inf")
+        for _ in range(5):  # best of 5 hides most of the noise from other processes
+            start = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - start)
+        print(f"{label:<24} {count / best:>14,.0f} codes/sec")
+
+if __name__ == "__main__":
+    benchmark_status_lookup()
@@ -49,8 +49,9 @@ def increment(number):
 def greet(name, punctuation="!"):
     return f"Hello, {name}{punctuation}"
 
-print(greet("Adrian"))          # Hello, Adrian!
-print(greet("Aden", "..."))     # Hello, Adem...
+if __name__ == "__main__":  # only when run as a script, importing stays silent (see 08_a_polite_suggestion.py)
+    print(greet("Adrian"))          # Hello, Adrian!
+    print(greet("Aden", "..."))     # Hello, Adem...
 
 # Use default values for optional behaviors.
 
@@ -61,8 +62,9 @@ def add_item(item, target=[]):
     target.append(item)
     return target
 
-print(add_item("a"))  # ['a']
-print(add_item("b"))  # ['a', 'b'] 😱
+if __name__ == "__main__":
+    print(add_item("a"))  # ['a']
+    print(add_item("b"))  # ['a', 'b'] 😱
 
 # ✅
 def add_item_safe(item, target=None):
@@ -73,6 +75,45 @@ def add_item_safe(item, target=None):
 
 # Use None as default sentinel for mutable types.
 
+# --------------------------------------------------------
+# ⚡ Going Further: Collecting Millions of Numbers
+# --------------------------------------------------------
+
+# A list stores pointers to full Python objects: every int costs 8 bytes of pointer + ~28 bytes of object.
+# array.array stores the raw machine numbers instead (8 bytes each for "q"/"d"), in one block of memory
+#      that it grows geometrically (over-allocating as it goes), so appends stay cheap on average.
+
+# Same call style as add_item_safe(), just with a compact target:
+
+import sys
+from array import array
+
+def _typecode_for(item):
+    return "d" if isinstance(item, float) else "q"  # 64-bit float or 64-bit signed int
+
+def add_item_compact(item, target=None):
+    if target is None:
+        target = array(_typecode_for(item))
+    target.append(item)
+    return target
+
+def extend_compact(items, target=None, typecode="q"):
+    """Bulk version: add everything from an iterable (generators too) in one C-level call."""
+    if target is None:
+        target = array(typecode)
+    target.extend(items)
+    return target
+
+def footprint_bytes(container):
+    """Memory a list or array really uses, including the objects a list points to."""
+    if isinstance(container, array):
+        return sys.getsizeof(container)  # the raw buffer is included
+    return sys.getsizeof(container) + sum(map(sys.getsizeof, container))
+
+# ⚠️ Only for numbers of one type: array("q") refuses floats and ints outside 64 bits (TypeError / OverflowError).
+# ⚠️ It's a memory trade, not a speed trick: ~4.5x less memory, but each append converts the int to raw bytes,
+#      so appending one by one is slower than list.append — prefer extend_compact() for bulk data.
+
 # --------------------------------------------------------
 # ✅ Use *args and **kwargs for flexibility
 # --------------------------------------------------------
@@ -82,10 +123,126 @@ def log_event(event, *args, **kwargs):
     print("Args ->", args)
     print("Keyword Args ->", kwargs)
 
-log_event("LOGIN", "blahblah123", ip="127.0.0.1", success=True)
+if __name__ == "__main__":
+    log_event("LOGIN", "blahblah123", ip="127.0.0.1", success=True)
 
 # Use these when you want to accept variable numbers of arguments.
 
+# --------------------------------------------------------
+# ⚡ Going Further: Logging Without Waiting for the Terminal
+# --------------------------------------------------------
+
+# Three print() calls per event means the caller waits for three writes (and a terminal) every time.
+# In a hot request path that's most of the cost. Instead, the caller can just drop the event into a buffer
+#      and a background thread writes whole batches of them (one JSON object per line).
+
+import atexit
+import threading
+import time
+from collections import deque
+
+class EventSink:
+    """Buffered, structured log_event(): callers append, a background thread writes in batches.
+
+    on_full="drop" throws new events away while the buffer is full (counted in .dropped),
+    on_full="block" makes the caller wait for room instead. Call flush() (or close()) before shutdown.
+    If a write fails, the events stay queued and the writer retries; .error holds the last failure.
+    """
+
+    def __init__(self, stream=None, *, capacity=65536, flush_interval=0.5, on_full="drop"):
+        if on_full not in ("drop", "block"):
+            raise ValueError(f"on_full must be 'drop' or 'block', not {on_full!r}")
+        self.stream = stream if stream is not None else sys.stdout
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self.on_full = on_full
+        self.dropped = 0
+        self.error = None  # the last exception from stream.write(), until a write succeeds again
+
+        self._buffer = deque()  # append()/popleft() are thread-safe, no lock on the caller's side
+        self._room = threading.Condition()  # only used by on_full="block"
+        self._write_lock = threading.Lock()
+        self._closed = threading.Event()
+        self._wake = threading.Event()  # set when the buffer fills up: write now, not at the next interval
+        self._writer = threading.Thread(target=self._run, name="EventSink", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def log_event(self, event, *args, **kwargs):
+        """Queue an event. Returns False if it was dropped because the buffer is full."""
+        if self._closed.is_set():
+            raise ValueError("log_event() on a closed EventSink")
+        if "ts" in kwargs or "args" in kwargs:
+            raise TypeError("'ts' and 'args' are the event's own fields, pick another keyword")
+        if len(self._buffer) >= self.capacity:
+            self._wake.set()
+            if self.on_full == "drop":
+                self.dropped += 1
+                return False
+            with self._room:
+                self._room.wait_for(lambda: len(self._buffer) < self.capacity or self._closed.is_set() or self.error)
+            if self._closed.is_set():
+                raise ValueError("log_event() on a closed EventSink")
+            if len(self._buffer) >= self.capacity:
+                raise RuntimeError("EventSink can't write, the buffer stays full") from self.error
+        self._buffer.append((time.time(), event, args, kwargs))
+        return True
+
+    def flush(self):
+        """Write out everything queued so far, right now."""
+        import json  # imported here, so importing this lesson stays cheap
+
+        with self._write_lock:
+            events = [self._buffer.popleft() for _ in range(len(self._buffer))]
+            try:
+                if events:
+                    self.stream.write("".join(
+                        json.dumps({"ts": timestamp, "event": event, "args": args, **kwargs}, default=repr) + "\n"
+                        for timestamp, event, args, kwargs in events
+                    ))
+                    self.stream.flush()
+            except Exception as error:
+                self._buffer.extendleft(reversed(events))  # back to the front, in order, for the next try
+                self.error = error
+                raise
+            else:
+                self.error = None
+            finally:
+                if self.on_full == "block":
+                    with self._room:
+                        self._room.notify_all()  # room to append, or an error to report: either way, wake up
+
+    def close(self):
+        if not self._closed.is_set():
+            self._closed.set()
+            self._wake.set()
+            with self._room:
+                self._room.notify_all()  # callers blocked on a full buffer get their ValueError
+            self._writer.join()
+            atexit.unregister(self.close)
+            self.flush()  # a failing write raises here, for the caller to see
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            if self._closed.is_set():
+                return  # close() does the last flush itself
+            try:
+                self.flush()
+            except Exception:
+                pass  # kept in .error; the events stay queued and the next round tries again
+
+# with EventSink(open("events.jsonl", "a"), flush_interval=0.1) as sink:
+#     sink.log_event("LOGIN", "blahblah123", ip="127.0.0.1", success=True)
+#     # -> {"ts": 1700000000.0, "event": "LOGIN", "args": ["blahblah123"], "ip": "127.0.0.1", "success": true}
+
 # --------------------------------------------------------
 # ✅ Use early returns instead of nesting
 # --------------------------------------------------------
@@ -107,6 +264,191 @@ def is_valid_email_clean(email):
 
 # Flat is better than nested (Zen of Python).
 
+# --------------------------------------------------------
+# ⚡ Going Further: Validating Millions of Addresses
+# --------------------------------------------------------
+
+# Calling is_valid_email_clean() once per row means one Python function call per row,
+#      and a list of 10 million True/False objects at the end.
+# For big lists it's cheaper to validate a whole chunk at once, with the check written inline
+#      (in 3.11+ a comprehension like this beats even map()/itertools chains),
+#      and to only keep what's interesting: the row numbers of the *invalid* addresses.
+
+# Note: an empty string never contains "@", so `"@" in email` alone covers both early returns above.
+
+import bisect
+import itertools
+import re
+
+class EmailReport:
+    """Result of validate_emails(): how many rows, and which ones were invalid (compact, sorted)."""
+
+    def __init__(self, total, invalid):
+        self.total = total
+        self.invalid = invalid  # array('Q') of row numbers
+
+    @property
+    def valid_count(self):
+        return self.total - len(self.invalid)
+
+    def is_valid(self, row):
+        position = bisect.bisect_left(self.invalid, row)
+        return position == len(self.invalid) or self.invalid[position] != row
+
+def _invalid_rows(chunk, offset, pattern=None):
+    if pattern is None:
+        return array("Q", [row for row, email in enumerate(chunk, offset) if not email or "@" not in email])
+    fullmatch = pattern.fullmatch
+    return array("Q", [row for row, email in enumerate(chunk, offset) if not email or not fullmatch(email)])
+
+def _chunks(source, chunk_size):
+    if hasattr(source, "readlines"):  # a file: read many lines per call, drop the line endings
+        while lines := source.readlines(chunk_size * 32):
+            yield list(map(str.rstrip, lines, itertools.repeat("\r\n")))
+    elif isinstance(source, (list, tuple)):
+        for start in range(0, len(source), chunk_size):
+            yield source[start:start + chunk_size]
+    else:
+        iterator = iter(source)
+        while chunk := list(itertools.islice(iterator, chunk_size)):
+            yield chunk
+
+def validate_emails(source, *, pattern=None, chunk_size=65536, workers=None):
+    """Validate every address in an iterable (or an open text file, one address per line).
+
+    Same rule as is_valid_email_clean() unless a regex `pattern` is given (it must match the whole address).
+    workers=N spreads the chunks over N processes. Returns an EmailReport.
+    """
+    if isinstance(pattern, str):
+        pattern = re.compile(pattern)  # compiled once, reused for every row (and sent to the workers)
+    invalid = array("Q")
+    total = 0
+
+    if not workers:
+        for chunk in _chunks(source, chunk_size):
+            invalid.extend(_invalid_rows(chunk, total, pattern))
+            total += len(chunk)
+        return EmailReport(total, invalid)
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()  # at most 2 chunks per worker in flight, so memory stays flat
+        for chunk in _chunks(source, chunk_size):
+            pending.append(pool.submit(_invalid_rows, chunk, total, pattern))
+            total += len(chunk)
+            if len(pending) >= 2 * workers:
+                invalid.extend(pending.popleft().result())
+        while pending:
+            invalid.extend(pending.popleft().result())
+    return EmailReport(total, invalid)
+
+# with open("addresses.txt") as addresses:
+#     report = validate_emails(addresses, workers=8)
+# print(report.valid_count, "valid,", len(report.invalid), "invalid, first bad rows:", report.invalid[:10].tolist())
+
+# --------------------------------------------------------
+# ⏱️ Going Further: How Slow Is My Function, Really?
+# --------------------------------------------------------
+
+# Small, single-purpose functions are also easy to *measure*. A decorator can wrap any of them
+#      (square, increment, process_and_print_and_log_and_square ...) and record how long each call took.
+
+# Averages hide the slow calls, so we keep a histogram and ask for percentiles (p50, p99, p99.9).
+# Like HdrHistogram, buckets get wider as values grow, so they always keep ~3% precision
+#      and the whole histogram stays a few hundred entries no matter how many calls we record.
+
+import functools
+import itertools
+import os
+
+PROFILING_ENABLED = os.environ.get("PYTHONIC_PROFILING", "1") != "0"
+
+class LatencyHistogram:
+    """Counts of latencies (in ns), bucketed to `precision_bits` significant bits."""
+
+    def __init__(self, precision_bits=5):
+        self.precision_bits = precision_bits
+        self.counts = {}  # bucket lower bound -> count
+        self.total = 0
+
+    def record(self, value):
+        shift = value.bit_length() - self.precision_bits
+        if shift > 0:
+            value = value >> shift << shift  # drop the low bits: that's the bucket
+        self.counts[value] = self.counts.get(value, 0) + 1
+        self.total += 1
+
+    def percentile(self, percent):
+        """Upper bound of the bucket holding the given percentile (0 if nothing was recorded)."""
+        rank = self.total * percent / 100
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= rank:
+                return bucket + (1 << max(bucket.bit_length() - self.precision_bits, 0)) - 1
+        return 0
+
+class _Profile:
+    def __init__(self):
+        self.calls = 0
+        self.latencies = LatencyHistogram()
+
+PROFILES = {}  # "module.function" -> _Profile, filled in as functions get decorated ("#2"... for repeats)
+
+def profiled(func=None, *, sample_every=1, enabled=None):
+    """Count calls to func and record the latency of every `sample_every`-th one.
+
+    When profiling is disabled (enabled=False, or PYTHONIC_PROFILING=0 in the environment)
+    func is returned untouched — zero overhead, not even a wrapper.
+    Every decorated function gets its own profile, even when two share a name.
+    """
+    if sample_every < 1:
+        raise ValueError(f"sample_every must be 1 or more, not {sample_every!r}")
+    if func is None:
+        return functools.partial(profiled, sample_every=sample_every, enabled=enabled)
+    if not (PROFILING_ENABLED if enabled is None else enabled):
+        return func
+
+    name = f"{func.__module__}.{func.__qualname__}"
+    if name in PROFILES:  # a lesson that redefines load(), or one function wrapped twice: separate counters
+        name = next(f"{name}#{n}" for n in itertools.count(2) if f"{name}#{n}" not in PROFILES)
+    profile = PROFILES[name] = _Profile()
+    record = profile.latencies.record
+    clock = time.perf_counter_ns
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        profile.calls += 1
+        if profile.calls % sample_every:
+            return func(*args, **kwargs)
+        start = clock()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            record(clock() - start)
+
+    return wrapper
+
+def latency_report(stream=None):
+    """Print calls and p50/p99/p99.9 latencies for every profiled function."""
+    stream = stream if stream is not None else sys.stdout
+    for name, profile in sorted(PROFILES.items()):
+        histogram = profile.latencies
+        stream.write(
+            f"{name:<48} calls {profile.calls:>10,}  sampled {histogram.total:>10,}"
+            f"  p50 {histogram.percentile(50):>8,} ns  p99 {histogram.percentile(99):>8,} ns"
+            f"  p99.9 {histogram.percentile(99.9):>8,} ns\n"
+        )
+
+# @profiled                     # every call
+# def square(n): ...
+#
+# @profiled(sample_every=100)   # hot path: time 1 call in 100, still count them all
+# def increment(number): ...
+#
+# latency_report()
+
 # --------------------------------------------------------
 # Summary
 # --------------------------------------------------------
@@ -117,3 +459,111 @@ def is_valid_email_clean(email):
 # ✅ Return early to reduce nesting
 # ✅ Use *args/**kwargs when needed — but not always
 # ✅ Embrace clarity over cleverness
+
+# --------------------------------------------------------
+# ⏱️ Measuring it: how long does the *caller* wait per event?
+# --------------------------------------------------------
+
+def _caller_latencies(log, count):
+    latencies = []
+    for i in range(count):
+        start = time.perf_counter_ns()
+        log("LOGIN", f"user{i}", ip="127.0.0.1", success=True)
+        latencies.append(time.perf_counter_ns() - start)
+    latencies.sort()
+    return latencies
+
+def benchmark_log_event(count=100_000):
+    import contextlib
+    import os
+    import tempfile
+
+    # Both versions write to a real file, so the terminal's speed doesn't decide the result
+    with tempfile.TemporaryDirectory() as folder:
+        with open(os.path.join(folder, "print.log"), "w") as out, contextlib.redirect_stdout(out):
+            printed = _caller_latencies(log_event, count)
+        with open(os.path.join(folder, "sink.jsonl"), "w") as out:
+            with EventSink(out, capacity=count) as sink:
+                batched = _caller_latencies(sink.log_event, count)
+
+        # A full buffer wakes the writer at once: blocked callers don't wait out flush_interval
+        with open(os.path.join(folder, "small.jsonl"), "w") as out:
+            with EventSink(out, capacity=2, flush_interval=5, on_full="block") as sink:
+                start = time.perf_counter()
+                for i in range(10):
+                    sink.log_event("TICK", i)
+                assert time.perf_counter() - start < 1
+
+    for label, latencies in (("print() x3", printed), ("EventSink.log_event", batched)):
+        p50, p99 = latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.99)]
+        print(f"{label:<20} p50 {p50:>7,} ns   p99 {p99:>8,} ns   ({count:,} events)")
+
+def benchmark_profiled(count=1_000_000):
+    import timeit
+
+    variants = {
+        "plain square()": square,
+        "@profiled, disabled": profiled(square, enabled=False),
+        "@profiled(sample_every=100)": profiled(sample_every=100, enabled=True)(square),
+        "@profiled, every call": profiled(square, enabled=True),
+    }
+    baseline = None
+    for label, func in variants.items():
+        per_call = min(timeit.repeat(lambda: func(7), number=count, repeat=5)) / count * 1e9
+        baseline = baseline or per_call
+        print(f"{label:<28} {per_call:>7.1f} ns/call   overhead {per_call - baseline:>6.1f} ns")
+    latency_report()  # the two enabled wrappers of square() are reported separately, as square and square#2
+
+def benchmark_validate_emails(rows=2_000_000):
+    import io
+
+    addresses = [f"user{i}@example.com" if i % 1000 else f"user{i}.example.com" for i in range(rows)]
+    expected = [i for i, email in enumerate(addresses) if not is_valid_email_clean(email)]
+    as_file = io.StringIO("\n".join(addresses) + "\n")
+
+    variants = {
+        "is_valid_email_clean per row": lambda: [is_valid_email_clean(email) for email in addresses],
+        "validate_emails (list)": lambda: validate_emails(addresses),
+        "validate_emails (file)": lambda: validate_emails(as_file),
+        "validate_emails (regex)": lambda: validate_emails(addresses, pattern=r"[^@\s]+@[^@\s]+"),
+        "validate_emails (2 workers)": lambda: validate_emails(addresses, workers=2),
+    }
+    for label, run in variants.items():
+        as_file.seek(0)
+        start = time.perf_counter()
+        result = run()
+        elapsed = time.perf_counter() - start
+        if isinstance(result, EmailReport):
+            assert result.total == rows and result.invalid.tolist() == expected
+        print(f"{label:<30} {rows / elapsed:>14,.0f} rows/sec")
+
+    # Missing values (None, "") are invalid, like is_valid_email_clean() says — not a TypeError
+    rows_with_gaps = ["a@b.c", None, "", "nope"]
+    assert validate_emails(rows_with_gaps).invalid.tolist() == [1, 2, 3]
+    assert validate_emails(rows_with_gaps, pattern=r"[^@\s]+@[^@\s]+").invalid.tolist() == [1, 2, 3]
+
+def benchmark_accumulators(count=10_000_000):
+    # The requested 100M ints need ~4 GB as a list; pass count=100_000_000 on a machine that has it.
+    variants = {
+        "add_item_safe (list)": lambda: _append_all(add_item_safe, [], count),
+        "add_item_compact (array)": lambda: _append_all(add_item_compact, array("q"), count),
+        "list(range)": lambda: list(range(count)),
+        "extend_compact(range)": lambda: extend_compact(range(count)),
+    }
+    for label, build in variants.items():
+        start = time.perf_counter()
+        container = build()
+        elapsed = time.perf_counter() - start
+        print(f"{label:<26} {count / elapsed:>14,.0f} items/sec   {footprint_bytes(container) / 1e6:>8,.1f} MB")
+        del container
+
+def _append_all(add, target, count):
+    for i in range(count):
+        add(i, target)
+    return target
+
+if __name__ == "__main__":
+    benchmark_log_event()
+    benchmark_profiled()
+    benchmark_validate_emails()
+    benchmark_accumulators()
@@ -39,12 +39,14 @@ first, second, *rest = names
 # --------------------------------------------------------
 
 # ❌ Old-school, un-Pythonic:
-for i in range(len(names)):
-    print(i, names[i])
+if __name__ == "__main__":  # only when run as a script, importing stays silent (see 08_a_polite_suggestion.py)
+    for i in range(len(names)):
+        print(i, names[i])
 
 # ✅ Pythonic:
-for i, name in enumerate(names):
-    print(i, name)
+if __name__ == "__main__":
+    for i, name in enumerate(names):
+        print(i, name)
 
 # --------------------------------------------------------
 # 🧩 tuple — like a list, but immutable
@@ -89,7 +91,8 @@ def greet(name, greeting="hi"):
     print(f"{greeting}, {name}!")
 
 options = {"name": "Adrian", "greeting": "Hello.👋"}
-greet(**options)
+if __name__ == "__main__":
+    greet(**options)
 
 # --------------------------------------------------------
 # 🧪 set — unordered, unique elements
@@ -113,8 +116,9 @@ difference = a - b        # {1, 2}
 symmetric = a ^ b         # {1, 2, 4, 5}
 
 # ✅ Membership is O(1):
-if 3 in a:
-    print("3 is in set a")
+if __name__ == "__main__":
+    if 3 in a:
+        print("3 is in set a")
 
 # --------------------------------------------------------
 # ⚠️ Anti-patterns
@@ -134,6 +138,104 @@ alice = Person(name="Adrian", age=15)
 # Or:
 # from dataclasses import dataclass
 
+# --------------------------------------------------------
+# ⚡ Going Further: When a list of numbers gets big
+# --------------------------------------------------------
+
+# [n ** 2 for n in numbers] creates one full Python int object per element (~28+ bytes each, plus the pointer).
+# For big numeric data there are two better containers:
+# - array.array (standard library): stores raw machine numbers, ~8 bytes each
+# - numpy.ndarray (third party): same compact storage, and the math runs in C over the whole array at once
+
+# transform() picks one of them ("backend") and gives the same numbers back either way.
+
+import functools
+from array import array
+
+INT64_SQUARE_LIMIT = 3_037_000_499  # abs(n) above this and n * n no longer fits in 64 bits
+NUMPY_MIN_SIZE = 64                 # below this numpy's per-call overhead wins; see benchmark_squares()
+
+@functools.lru_cache(maxsize=None)
+def _numpy():
+    """Import numpy on first use, or None if it isn't installed."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+def _list_backend(numbers, func):
+    return [func(n) for n in numbers]
+
+def _array_backend(numbers, func):
+    # straight into the array, no list of results first; raises OverflowError instead of wrapping around
+    try:
+        return array("q", map(func, numbers))
+    except TypeError:  # a float came out (x / 2 ...): start over as doubles
+        return array("d", map(func, numbers))
+
+def _numpy_backend(numbers, func):
+    np = _numpy()
+    if np is None:
+        raise ImportError("the 'numpy' backend needs numpy installed")
+    return func(np.asarray(numbers))  # func sees the whole array: vectorized
+
+_BACKENDS = {"list": _list_backend, "array": _array_backend, "numpy": _numpy_backend}
+
+def transform(numbers, func, *, backend="auto"):
+    """Apply an arithmetic func (like lambda x: x * x) to every number.
+
+    backend="list" returns a list, "array" an array.array, "numpy" a numpy array —
+    for "numpy" func gets the whole array, so stick to operators (+, *, ** ...).
+    "auto" uses numpy for big inputs when it's installed, and a list otherwise.
+    """
+    if not isinstance(numbers, (list, tuple, array)) and not hasattr(numbers, "__array__"):
+        numbers = list(numbers)  # generators etc.
+    if backend == "auto":
+        backend = "numpy" if len(numbers) >= NUMPY_MIN_SIZE and _numpy() is not None else "list"
+    try:
+        run = _BACKENDS[backend]
+    except KeyError:
+        raise ValueError(f"unknown backend {backend!r}, expected one of {sorted(_BACKENDS)}") from None
+    return run(numbers, func)
+
+def _square(n):
+    return n * n
+
+def square_all(numbers, *, backend="auto"):
+    """Squares of all numbers — same values from every backend (or an OverflowError)."""
+    if not isinstance(numbers, (list, tuple, array)) and not hasattr(numbers, "__array__"):
+        numbers = list(numbers)
+    np = _numpy()
+    if np is not None and (backend == "numpy" or backend == "auto" and len(numbers) >= NUMPY_MIN_SIZE):
+        values = np.asarray(numbers)
+        if not _squares_overflow(values):
+            return transform(values, _square, backend="numpy")  # converted once
+        # numpy int64 would silently wrap around, Python ints never do
+        if backend == "numpy":
+            raise OverflowError("squares don't fit in 64-bit integers, use backend='list'")
+        backend = "list"
+        numbers = values
+    if np is not None and hasattr(numbers, "__array__"):
+        # the other backends square one element at a time, and a numpy int64 element wraps
+        # just like the whole array would: hand them Python ints instead
+        numbers = np.asarray(numbers).tolist()
+    return transform(numbers, _square, backend=backend)
+
+def _squares_overflow(values):
+    """Would squaring this numpy array overflow 64-bit integers? Vectorized; floats never do (they go to inf)."""
+    kind = values.dtype.kind
+    if kind == "O":  # Python ints too big for numpy to store natively
+        return True
+    if kind not in "iu" or not values.size:
+        return False
+    # min()/max() instead of abs(): no temporary array, and abs(-2**63) would overflow itself
+    return values.max() > INT64_SQUARE_LIMIT or (kind == "i" and values.min() < -INT64_SQUARE_LIMIT)
+
+# square_all(range(10))                   # [0, 1, 4, ..., 81]
+# square_all(range(10), backend="array")  # array('q', [0, 1, 4, ..., 81])
+# transform(scores, lambda x: x * 2 + 1)  # any arithmetic, not just squares
+
 # --------------------------------------------------------
 # ✅ Recap: Be intentional
 # --------------------------------------------------------
@@ -144,3 +246,49 @@ alice = Person(name="Adrian", age=15)
 # - Use set when you need uniqueness or set math
 
 # Choose based on semantics — Pythonic = "clear intent"
+
+# --------------------------------------------------------
+# ⏱️ Measuring it: where does each backend start to pay off?
+# --------------------------------------------------------
+
+def benchmark_squares(max_size=1_000_000):
+    import timeit
+
+    backends = ["list", "array"] + (["numpy"] if _numpy() is not None else [])
+    break_even = {}
+    size = 1
+    print(f"{'size':>10}" + "".join(f"{name:>14}" for name in backends) + "   (µs per call)")
+    while size <= max_size:
+        numbers = list(range(size))
+        expected = square_all(numbers, backend="list")
+        timings = {}
+        for name in backends:
+            assert list(square_all(numbers, backend=name)) == expected
+            # numpy gets an array already: converting lists is a one-off cost you'd pay once, not per call
+            data = _numpy().arange(size) if name == "numpy" else numbers
+            runs = max(1, 100_000 // size)
+            timings[name] = min(timeit.repeat(lambda: square_all(data, backend=name), number=runs, repeat=3)) / runs
+            if name != "list" and timings[name] < timings["list"]:
+                break_even.setdefault(name, size)
+        print(f"{size:>10,}" + "".join(f"{timings[name] * 1e6:>14,.2f}" for name in backends))
+        size *= 4
+
+    for name in backends[1:]:
+        where = f"from ~{break_even[name]:,} numbers" if name in break_even else "never, up to this size"
+        print(f"{name} beats the list comprehension {where}")
+
+    # array.array is about memory, not speed: compare what a million squares actually take
+    import sys
+    as_list = square_all(range(max_size), backend="list")
+    as_array = square_all(range(max_size), backend="array")
+    list_bytes = sys.getsizeof(as_list) + sum(map(sys.getsizeof, as_list))
+    print(f"{max_size:,} squares: list {list_bytes / 1e6:.1f} MB, array {sys.getsizeof(as_array) / 1e6:.1f} MB")
+    if "numpy" not in backends:
+        print("numpy isn't installed, skipped it")
+    else:
+        # int64 input, squares past 64 bits: exact Python ints from every backend but "numpy", never wrapped around
+        big = _numpy().array([2**40] + [3] * 99)
+        assert square_all(big)[0] == square_all(big[:2], backend="list")[0] == 2**80
+
+if __name__ == "__main__":
+    benchmark_squares()
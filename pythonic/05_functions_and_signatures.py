@@ -41,14 +41,31 @@ def handle_data(x):
     pass
 
 # ✅ Good:
-def normalize_scores(scores):
-    # Clearly normalizes scores
-    pass
+def normalize_scores(scores, *, method="minmax"):
+    # Clearly normalizes scores (in place: the name is a verb, it *does* something)
+    if not _is_numpy(scores) and not isinstance(scores, MutableSequence):
+        raise TypeError(f"normalize_scores() changes scores in place, it needs a list (or numpy array), not {type(scores).__name__}")
+    shift, scale = _normalization(scores, method)
+    if _is_numpy(scores):
+        scores -= shift  # vectorized, no copy (scores needs a float dtype)
+        scores *= scale
+    else:
+        scores[:] = [(score - shift) * scale for score in scores]
+    return scores
 
 # ✅ Even better (naming the noun being returned):
-def get_normalized_scores(scores):
-    # Fetches normalized scores
-    pass
+def get_normalized_scores(scores, *, method="minmax"):
+    # Fetches normalized scores (a new list / array, the input stays untouched)
+    if not _is_numpy(scores) and not isinstance(scores, Sequence):
+        scores = list(scores)  # generators etc.: the statistics pass would use them up
+    shift, scale = _normalization(scores, method)
+    if _is_numpy(scores):
+        return (scores - shift) * scale
+    return [(score - shift) * scale for score in scores]
+
+# method="minmax" maps scores onto 0..1, method="zscore" onto "standard deviations from the mean".
+# Both boil down to (score - shift) * scale, so the only real work is finding shift and scale.
+#     (the helpers, and a version for files bigger than RAM, are in "One Pass, Every Statistic" below)
 
 # --------------------------------------------------------
 # ✅ Default parameters and keyword arguments
@@ -73,6 +90,153 @@ fetch_data("alice", raw=True, retry=False)
 # The `*` forces keyword-only arguments.
 # It improves readability when you have optional config-like params.
 
+# --------------------------------------------------------
+# ⚡ Going Further: A Real fetch_data(), Thousands at a Time
+# --------------------------------------------------------
+
+# The same keyword-only flags, but the function actually talks to an HTTP backend.
+# Two things make fetching thousands of users fast:
+# - keep-alive: a small pool of open connections is reused, instead of a new TCP handshake per request
+# - asyncio: while one request waits for the network, the others keep going (up to `concurrency` at once)
+
+# Only the standard library: a minimal HTTP/1.1 GET on top of asyncio streams.
+# (asyncio and json are imported inside the functions, so importing this lesson stays cheap —
+#      see the note on lazy imports in 07_iterators_and_generators.py)
+
+class FetchError(Exception):
+    """The backend answered with an error status, or the connection failed."""
+
+class _ConnectionPool:
+    """Keep-alive connections to one host, at most `size` open at the same time."""
+
+    def __init__(self, host, port, size):
+        import asyncio
+
+        self.host, self.port = host, port
+        self._idle = []  # (reader, writer) pairs ready to reuse
+        self._slots = asyncio.Semaphore(size)
+
+    async def get(self, path):
+        import asyncio
+
+        async with self._slots:
+            fresh_only = False
+            while True:
+                reused = bool(self._idle) and not fresh_only
+                writer = None
+                answered = False  # did any byte of the response arrive?
+                try:
+                    if reused:
+                        reader, writer = self._idle.pop()
+                    else:
+                        reader, writer = await asyncio.open_connection(self.host, self.port)
+                    writer.write(f"GET {path} HTTP/1.1\r\nHost: {self.host}\r\n\r\n".encode())
+                    await writer.drain()
+                    status_line = await reader.readuntil(b"\r\n")
+                    answered = True
+                    status = int(status_line.split()[1])
+                    headers = {}
+                    while (line := await reader.readuntil(b"\r\n")) != b"\r\n":
+                        name, _, value = line.decode("latin-1").partition(":")
+                        headers[name.strip().lower()] = value.strip()
+                    body, reusable = await _read_body(reader, status, headers)
+                except (OSError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError, IndexError) as error:
+                    if writer is not None:
+                        writer.close()
+                    answered = answered or bool(getattr(error, "partial", b""))
+                    if reused and not answered:
+                        # The server closed this idle keep-alive connection in the meantime:
+                        #      nothing was processed, so it's safe to send the request again on a new one
+                        fresh_only = True
+                        continue
+                    raise FetchError(f"connection to {self.host}:{self.port} failed: {error!r}") from error
+                except BaseException:
+                    # cancelled (a timeout ...) or anything else mid-request: the connection is in an
+                    # unknown state, so it can't go back to _idle — close it rather than leak the socket
+                    if writer is not None:
+                        writer.close()
+                    raise
+
+                if reusable and headers.get("connection", "").lower() != "close":
+                    self._idle.append((reader, writer))
+                else:
+                    writer.close()
+                return status, body
+
+    async def close(self):
+        while self._idle:
+            _, writer = self._idle.pop()
+            writer.close()
+            await writer.wait_closed()
+
+async def _read_body(reader, status, headers):
+    """(body, whether the connection can be reused): Content-Length, chunked, or everything until close."""
+    if 100 <= status < 200 or status in (204, 304):
+        return b"", True
+    if "chunked" in headers.get("transfer-encoding", "").lower():
+        parts = []
+        while size := int((await reader.readuntil(b"\r\n")).split(b";")[0], 16):  # hex size; 0 ends the body
+            parts.append(await reader.readexactly(size))
+            await reader.readexactly(2)  # the \r\n after each chunk
+        while await reader.readuntil(b"\r\n") != b"\r\n":
+            pass  # trailer headers
+        return b"".join(parts), True
+    if "content-length" in headers:
+        return await reader.readexactly(int(headers["content-length"])), True
+    return await reader.read(), False  # no length at all: the body ends when the server closes
+
+class UserAPI:
+    """fetch_data()/fetch_many() against http://host:port/users/<user>, over pooled keep-alive connections."""
+
+    def __init__(self, host="127.0.0.1", port=80, *, pool_size=32, retries=3):
+        self.retries = retries
+        self._pool = _ConnectionPool(host, port, pool_size)
+
+    async def fetch_data(self, user, *, raw=False, retry=True):
+        """The user's record as parsed JSON (raw=True: the response bytes as they came)."""
+        import asyncio
+        import json
+        from urllib.parse import quote
+
+        path = "/users/" + quote(str(user), safe="")  # spaces, "/", CR/LF ... can't break the request line
+        attempts = 1 + (self.retries if retry else 0)
+        for attempt in range(attempts):
+            try:
+                status, body = await self._pool.get(path)
+                if status < 500:
+                    break
+                error = FetchError(f"server error {status} for {user!r}")
+            except FetchError as failure:
+                error = failure
+            if attempt + 1 < attempts:
+                await asyncio.sleep(0.01 * 2 ** attempt)  # back off a little more every time
+        else:
+            raise error
+
+        if status >= 400:
+            raise FetchError(f"{status} for {user!r}")
+        return body if raw else json.loads(body)
+
+    async def fetch_many(self, users, *, concurrency=32, raw=False, retry=True):
+        """fetch_data() for every user, at most `concurrency` in flight; results in the same order."""
+        import asyncio
+
+        limit = asyncio.Semaphore(concurrency)
+
+        async def fetch_one(user):
+            async with limit:
+                return await self.fetch_data(user, raw=raw, retry=retry)
+
+        return await asyncio.gather(*map(fetch_one, users))
+
+    async def close(self):
+        await self._pool.close()
+
+# async def main():
+#     api = UserAPI("api.internal", 8080, pool_size=64)
+#     users = await api.fetch_many(all_user_names, concurrency=64)
+#     await api.close()
+
 # --------------------------------------------------------
 # ✅ Return values
 # --------------------------------------------------------
@@ -81,7 +245,8 @@ fetch_data("alice", raw=True, retry=False)
 def process():
     print("done")
 
-result = process()  # Returns None (maybe we wanted data?)
+if __name__ == "__main__":  # only when run as a script, importing stays silent (see 08_a_polite_suggestion.py)
+    result = process()  # Returns None (maybe we wanted data?)
 
 # ✅ Pythonic: Functions should _return_, not print.
 def process(data):
@@ -108,19 +273,244 @@ def parse(x):
 
 # Or raise if it's an error, not just a missing case.
 
+# --------------------------------------------------------
+# ⚡ Going Further: Routing Millions of URLs by Prefix
+# --------------------------------------------------------
+
+# parse() knows one prefix. Routing by scheme *and* host needs many: "https://api.example.com/" -> "api",
+#      "https://cdn." -> "static", "http://" -> "insecure" ... and the longest matching one should win.
+# Trying every prefix with startswith() costs O(number of prefixes) per URL — fine for 10, hopeless for 100k.
+
+# PrefixClassifier sorts the prefixes once. For a URL, bisect finds the largest prefix that sorts before it:
+#      if that one isn't a prefix of the URL, the answer can only be one of *its* prefixes (everything
+#      sorted between a real prefix and the URL starts with that prefix). So every prefix remembers its
+#      longest shorter prefix in the set, and we follow that short chain. Per URL: one bisect
+#      (log2(100k) ≈ 17 string comparisons, in C) and usually one startswith().
+# Like the ✅ parse(): a tag for a match, None otherwise — one type plus None.
+
+import bisect
+
+class PrefixClassifier:
+    """Tag strings by the longest matching prefix, compiled from {prefix: tag}."""
+
+    def __init__(self, tags):
+        self._prefixes = sorted(tags)
+        self._tags = [tags[prefix] for prefix in self._prefixes]
+        self._parents = []  # index of the longest shorter prefix of each prefix, or -1
+        chain = []          # the prefixes (indices) that the current one is nested in
+        for i, prefix in enumerate(self._prefixes):
+            while chain and not prefix.startswith(self._prefixes[chain[-1]]):
+                chain.pop()
+            self._parents.append(chain[-1] if chain else -1)
+            chain.append(i)
+
+    def tag(self, url):
+        """The tag of the longest prefix of url, or None."""
+        i = bisect.bisect_right(self._prefixes, url) - 1
+        while i >= 0:
+            if url.startswith(self._prefixes[i]):
+                return self._tags[i]
+            i = self._parents[i]
+        return None
+
+    def tag_all(self, urls):
+        """(url, tag) for every url, lazily — one pass over a stream of any length."""
+        return ((url, self.tag(url)) for url in urls)
+
+    def filter(self, urls, *tags):
+        """The urls that match any prefix (or, if tags are given, a prefix with one of those tags)."""
+        if not tags:
+            return (url for url in urls if self.tag(url) is not None)  # a tag of 0 or "" is still a match
+        wanted = set(tags)
+        return (url for url in urls if self.tag(url) in wanted)
+
+# router = PrefixClassifier({"http://": "insecure", "https://": "web", "https://api.example.com/": "api"})
+# router.tag("https://api.example.com/v1/users")   -> "api"
+# router.tag("ftp://files.example.com")            -> None
+# for url in router.filter(open("access.log"), "api"): ...
+
 # --------------------------------------------------------
 # 🪄 Use unpacking to return multiple values
 # --------------------------------------------------------
 
+from collections.abc import Collection
+
 def get_bounds(numbers):
     # Returns a tuple with min and max values
-    return min(numbers), max(numbers)
+    if isinstance(numbers, Collection):  # lists, sets, dict keys ...: can be walked twice
+        return min(numbers), max(numbers)
+    # A generator can only be read once, so min() + max() would find it empty the second time:
+    #      one pass that tracks both (anything comparable works: numbers, strings, dates ...)
+    values = iter(numbers)
+    for low in values:
+        break
+    else:
+        raise ValueError("get_bounds() arg is an empty iterable")
+    high = low
+    for value in values:
+        if value < low:
+            low = value
+        elif value > high:
+            high = value
+    return low, high
 
 low, high = get_bounds([1, 9, 2, 7])
-print(low, high)
+if __name__ == "__main__":
+    print(low, high)
 
 # ✅ Pythonic: unpacked tuple return values are idiomatic
 
+# --------------------------------------------------------
+# ⚡ Going Further: One Pass, Every Statistic
+# --------------------------------------------------------
+
+# min() and max() each walk the whole input. That's two passes — impossible for a generator
+#      (like read_large_file() / square_numbers() from 07_iterators_and_generators.py), and wasteful for big files.
+# RunningStats collects count, min, max, mean and variance in a single pass (Welford's method,
+#      which stays accurate where the naive "sum of squares" formula loses precision).
+
+# Two RunningStats can be merged (Chan et al.'s formula), so each process can summarize its own
+#      part of the data and the parent just combines the (tiny, picklable) partial results.
+
+import itertools
+import math
+from collections.abc import MutableSequence, Sequence
+
+class RunningStats:
+    """Count, min, max, mean and variance of a stream of numbers, in one pass. Mergeable."""
+
+    def __init__(self, numbers=()):
+        self.count = 0
+        self.mean = 0.0
+        self.min = None
+        self.max = None
+        self._m2 = 0.0  # sum of squared differences from the mean
+        self.update(numbers)
+
+    def update(self, numbers, chunk_size=4096):
+        """Add every number from any iterable (lists, generators, file readers ...)."""
+        numbers = iter(numbers)
+        while chunk := list(itertools.islice(numbers, chunk_size)):
+            # Summarize a chunk with (mostly) C-level calls, then merge it in: much cheaper than per number
+            chunk_stats = RunningStats()
+            chunk_stats.count = len(chunk)
+            chunk_stats.mean = math.fsum(chunk) / len(chunk)
+            chunk_stats.min, chunk_stats.max = min(chunk), max(chunk)
+            chunk_stats._m2 = math.fsum((x - chunk_stats.mean) ** 2 for x in chunk)
+            self.merge(chunk_stats)
+        return self
+
+    def add(self, x):
+        """Add a single number (Welford's update)."""
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (x - self.mean)
+        self.min = x if self.min is None or x < self.min else self.min
+        self.max = x if self.max is None or x > self.max else self.max
+
+    def merge(self, other):
+        """Fold another RunningStats (e.g. from another process) into this one."""
+        if not other.count:
+            return self
+        if not self.count:
+            self.count, self.mean, self._m2, self.min, self.max = other.count, other.mean, other._m2, other.min, other.max
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self._m2 += other._m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    @property
+    def variance(self):
+        """Sample variance, like statistics.variance()."""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def pvariance(self):
+        """Population variance, like statistics.pvariance()."""
+        return self._m2 / self.count if self.count else 0.0
+
+    @property
+    def stdev(self):
+        return math.sqrt(self.variance)
+
+    def __repr__(self):
+        return (f"RunningStats(count={self.count}, min={self.min}, max={self.max},"
+                f" mean={self.mean:.6g}, stdev={self.stdev:.6g})")
+
+# stats = RunningStats(x * x for x in range(10))        # generators work: one pass
+#
+# with ProcessPoolExecutor() as pool:                    # each worker returns RunningStats(its_part)
+#     total = functools.reduce(RunningStats.merge, pool.map(summarize_part, parts), RunningStats())
+
+# RunningStats is also what normalize_scores() / get_normalized_scores() (at the top) are built on:
+
+def _is_numpy(scores):
+    return type(scores).__module__ == "numpy"  # no need to import numpy just to check
+
+def _normalization(scores, method):
+    """(shift, scale) so that (score - shift) * scale is the normalized score."""
+    if _is_numpy(scores):
+        low, high, mean, stdev = scores.min(), scores.max(), scores.mean(), scores.std()  # vectorized
+    else:
+        stats = RunningStats(scores)
+        low, high, mean, stdev = stats.min, stats.max, stats.mean, math.sqrt(stats.pvariance)
+    return _shift_and_scale(low, high, mean, stdev, method)
+
+def _shift_and_scale(low, high, mean, stdev, method):
+    if method == "minmax":
+        return low, (1.0 / (high - low) if high != low else 0.0)
+    if method == "zscore":
+        return mean, (1.0 / stdev if stdev else 0.0)
+    raise ValueError(f"method must be 'minmax' or 'zscore', not {method!r}")
+
+# Files bigger than RAM: a score file of raw float64 values (the layout numpy.memmap / array.tofile() use)
+#      is normalized in two streaming passes — pass 1 collects the statistics, pass 2 rewrites every chunk
+#      in place. Memory use is one chunk, whether the file is 50 MB or 50 GB.
+
+def normalize_score_file(path, *, method="minmax", chunk_items=1 << 16):
+    """Normalize a file of native-endian float64 scores in place, chunk by chunk."""
+    try:
+        import numpy
+    except ImportError:
+        numpy = None
+
+    if numpy is not None:
+        scores = numpy.memmap(path, dtype=numpy.float64, mode="r+")
+        chunks = [scores[start:start + chunk_items] for start in range(0, len(scores), chunk_items)]
+        stats = RunningStats()
+        for chunk in chunks:  # pass 1: merge per-chunk statistics, each computed vectorized
+            part = RunningStats()
+            part.count, part.mean, part.min, part.max = len(chunk), float(chunk.mean()), float(chunk.min()), float(chunk.max())
+            part._m2 = float(chunk.var()) * len(chunk)
+            stats.merge(part)
+        shift, scale = _shift_and_scale(stats.min, stats.max, stats.mean, math.sqrt(stats.pvariance), method)
+        for chunk in chunks:  # pass 2: rewrite in place
+            chunk -= shift
+            chunk *= scale
+        scores.flush()
+        return stats
+
+    from array import array
+
+    with open(path, "r+b") as file:
+        stats = RunningStats()
+        while block := file.read(chunk_items * 8):  # pass 1
+            stats.update(array("d", block))
+        shift, scale = _shift_and_scale(stats.min, stats.max, stats.mean, math.sqrt(stats.pvariance), method)
+
+        file.seek(0)
+        while block := file.read(chunk_items * 8):  # pass 2
+            normalized = array("d", [(score - shift) * scale for score in array("d", block)])
+            file.seek(-len(block), 1)  # back to where this chunk started ...
+            file.write(normalized)     # ... and overwrite it
+    return stats
+
 # --------------------------------------------------------
 # 🧼 Don’t overuse *args and **kwargs unless needed
 # --------------------------------------------------------
@@ -136,6 +526,9 @@ def log_event(event_name, timestamp, **extra_info):
     # This is better because we specify the main arguments
     pass
 
+# ^ for a log_event() that actually writes events (buffered, in batches, off the caller's thread)
+#      see EventSink in 03_clean_functions.py
+
 # --------------------------------------------------------
 # ⚖️ Avoid too many params
 # --------------------------------------------------------
@@ -168,6 +561,149 @@ def connect(cfg: DBConfig):
 
 # This improves readability, default handling, and avoids long signatures
 
+# --------------------------------------------------------
+# ⚡ Going Further: Reusing Connections per DBConfig
+# --------------------------------------------------------
+
+# A naive connect(cfg) opens a brand new connection on every call — handshake, auth, maybe TLS, each time.
+# A pool keeps a few connections open and lends them out. Since DBConfig already bundles everything
+#      that identifies "the same database", it makes a natural key: one pool per config.
+
+# DBConfig itself isn't hashable (a regular dataclass has __eq__ but no __hash__),
+#      so the key is its frozen form: dataclasses.astuple(cfg).
+
+import contextlib
+import dataclasses
+import threading
+import time
+from collections import deque
+
+class PoolTimeout(TimeoutError):
+    """No connection became free within cfg.timeout seconds."""
+
+class ConnectionPool:
+    """Thread-safe pool of connections for one DBConfig.
+
+    open_connection(cfg) opens a real connection (sqlite3.connect, psycopg.connect ...).
+    Connections idle for longer than `check_after` seconds are health-checked before they're lent out.
+    """
+
+    def __init__(self, cfg, open_connection, *, min_size=1, max_size=10, check_after=30.0, health_check=None):
+        self.cfg = cfg
+        self.max_size = max_size
+        self.check_after = check_after
+        self._open_connection = open_connection
+        self._health_check = health_check or _select_one
+        self._idle = deque()  # (connection, when it was given back)
+        self._open = 0        # idle + lent out
+        self._available = threading.Condition()
+        for _ in range(min_size):
+            self._idle.append((self._connect(), time.monotonic()))
+            self._open += 1
+
+    @contextlib.contextmanager
+    def acquire(self):
+        """with pool.acquire() as connection: ... — the connection goes back to the pool afterwards.
+
+        If the block raises, the open transaction is rolled back first, so the next borrower
+        never sees half-done work; a connection that can't even roll back is closed and replaced.
+        """
+        connection = self._checkout()
+        try:
+            yield connection
+        except BaseException:
+            try:
+                connection.rollback()
+                rolled_back = True
+            except Exception:
+                rolled_back = False
+            if rolled_back:
+                self._give_back(connection)
+            else:
+                with contextlib.suppress(Exception):
+                    connection.close()
+                with self._available:
+                    self._open -= 1  # a new one gets opened on demand
+                    self._available.notify()
+            raise  # the error from the with block, not from the rollback
+        self._give_back(connection)
+
+    def _give_back(self, connection):
+        with self._available:
+            self._idle.append((connection, time.monotonic()))
+            self._available.notify()
+
+    def close(self):
+        with self._available:
+            while self._idle:
+                connection, _ = self._idle.pop()
+                connection.close()
+                self._open -= 1
+
+    def _checkout(self):
+        deadline = time.monotonic() + self.cfg.timeout
+        with self._available:
+            while not self._idle and self._open >= self.max_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._available.wait(remaining):
+                    raise PoolTimeout(f"no free connection to {self.cfg.host} within {self.cfg.timeout}s")
+            if self._idle:
+                connection, returned_at = self._idle.pop()  # most recently used: most likely still alive
+            else:
+                connection, returned_at = None, None
+                self._open += 1  # reserve the slot before connecting, outside the lock
+
+        if connection is not None:
+            if time.monotonic() - returned_at < self.check_after or self._is_healthy(connection):
+                return connection
+            with contextlib.suppress(Exception):
+                connection.close()
+        try:
+            return self._connect()
+        except BaseException:
+            with self._available:
+                self._open -= 1
+                self._available.notify()
+            raise
+
+    def _connect(self):
+        """Open a connection, retrying up to cfg.retries times with a growing pause."""
+        for attempt in range(self.cfg.retries + 1):
+            try:
+                return self._open_connection(self.cfg)
+            except Exception:
+                if attempt == self.cfg.retries:
+                    raise
+                time.sleep(min(0.05 * 2 ** attempt, self.cfg.timeout))
+
+    def _is_healthy(self, connection):
+        try:
+            self._health_check(connection)
+        except Exception:
+            return False
+        return True
+
+def _select_one(connection):
+    connection.cursor().execute("SELECT 1")  # works for any DB-API driver
+
+_POOLS = {}
+_POOLS_LOCK = threading.Lock()
+
+def get_pool(cfg, open_connection, **options):
+    """The pool for this config, created on first use (options: see ConnectionPool)."""
+    key = dataclasses.astuple(cfg)
+    with _POOLS_LOCK:
+        if key not in _POOLS:
+            _POOLS[key] = ConnectionPool(cfg, open_connection, **options)
+        return _POOLS[key]
+
+# import sqlite3
+# cfg = DBConfig(host="app.db", port=0, user="", password="", timeout=2)
+# open_sqlite = lambda cfg: sqlite3.connect(cfg.host, timeout=cfg.timeout, check_same_thread=False)
+#
+# with get_pool(cfg, open_sqlite, max_size=4).acquire() as connection:
+#     connection.execute("SELECT 1")
+
 # --------------------------------------------------------
 # 📎 Prefer simple composition over deep nesting
 # --------------------------------------------------------
@@ -193,6 +729,124 @@ def load():
 # ✅ Even more concise:
 def load():
     return all([check(), ready(), valid()])
+#                 ^ note the [...]: the list is built first, so all three run even if check() already failed.
+#                   all(f() for f in (check, ready, valid)) would stop early — but still one at a time.
+
+# --------------------------------------------------------
+# ⚡ Going Further: Readiness Checks, All at Once
+# --------------------------------------------------------
+
+# In a real service check(), ready() and valid() are probes: ping the database, hit a health endpoint,
+#      look for a file on a network share. Each one mostly *waits*, so running them one after another
+#      costs the sum of their latencies. ReadinessChecks runs them at the same time instead:
+# - every registered check goes to a thread pool at once, so the wait is about the *slowest* one
+# - the first failure answers the question: not ready. Checks that haven't started are cancelled
+# - each result is cached for that check's own `ttl`, so asking again a moment later is free
+#      (a check still running from an earlier call is joined, not started a second time)
+
+# Threads can't be killed — a check that's already running finishes in the background,
+#      and its result still lands in the cache for next time.
+
+class ReadinessChecks:
+    """Registered checks (callables returning a bool), run concurrently, each cached for its own ttl."""
+
+    def __init__(self, *, max_workers=None):
+        self.max_workers = max_workers
+        self._checks = {}   # name -> (check, ttl)
+        self._cache = {}    # name -> (result, expires at)
+        self._running = {}  # name -> future, while a check is in progress
+        self._waiters = {}  # future -> how many is_ready() calls are waiting on it
+        self._lock = threading.Lock()
+        self._executor = None  # started on first use, so creating one of these is free
+
+    def register(self, check, *, ttl=5.0, name=None):
+        """Add a check; returns it unchanged, so this also works as a decorator."""
+        self._checks[name or check.__name__] = (check, ttl)
+        return check
+
+    def is_ready(self, *, timeout=None):
+        """True if every check passes. A failing, raising or (after `timeout` seconds) hanging check means False."""
+        from concurrent.futures import TimeoutError as FuturesTimeout, as_completed
+
+        futures, started = [], []
+        now = time.monotonic()
+        with self._lock:
+            fresh = {name: result for name, (result, expires_at) in self._cache.items() if now < expires_at}
+            if not all(fresh.values()):
+                return False  # a cached failure: nothing needs to run (checked before anything is submitted)
+            for name, (check, ttl) in self._checks.items():
+                if name in fresh:
+                    continue
+                if name not in self._running:
+                    self._running[name] = self._submit(check)
+                    started.append((name, ttl, self._running[name]))
+                future = self._running[name]
+                self._waiters[future] = self._waiters.get(future, 0) + 1
+                futures.append(future)
+        for name, ttl, future in started:
+            # outside the lock: for a check that's already done, the callback runs right here and takes the lock
+            future.add_done_callback(lambda future, name=name, ttl=ttl: self._finished(name, ttl, future))
+
+        try:
+            for future in as_completed(futures, timeout=timeout):
+                if future.cancelled() or not future.result():
+                    return False
+        except FuturesTimeout:
+            return False
+        finally:
+            ours, unwanted = {future for _, _, future in started}, []
+            with self._lock:
+                for future in futures:
+                    self._waiters[future] -= 1
+                    if not self._waiters[future]:
+                        del self._waiters[future]
+                        if future in ours:
+                            unwanted.append(future)  # ours, and no other caller is waiting on it
+            for future in unwanted:
+                future.cancel()  # outside the lock (its callback takes it); only queued checks can be cancelled
+        return True
+
+    def invalidate(self, name=None):
+        """Forget the cached result of one check (or of all of them)."""
+        with self._lock:
+            if name is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(name, None)
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _submit(self, check):
+        if self._executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            workers = self.max_workers or min(32, len(self._checks))  # the default (cpu + 4) is too few for I/O
+            self._executor = ThreadPoolExecutor(workers, thread_name_prefix="readiness")
+        return self._executor.submit(_run_check, check)
+
+    def _finished(self, name, ttl, future):
+        with self._lock:
+            self._running.pop(name, None)
+            if not future.cancelled():
+                self._cache[name] = (future.result(), time.monotonic() + ttl)
+
+def _run_check(check):
+    try:
+        return bool(check())
+    except Exception:
+        return False  # a probe that blows up is a failed probe
+
+# ✅ Concurrent, cached:
+readiness = ReadinessChecks()
+readiness.register(check, ttl=5.0)
+readiness.register(ready, ttl=1.0)   # changes often: ask again soon
+readiness.register(valid, ttl=60.0)  # expensive and stable: ask rarely
+
+def load():
+    return readiness.is_ready(timeout=2.0)
 
 # --------------------------------------------------------
 # ⛓ When to use lambda vs def?
@@ -206,6 +860,139 @@ sorted(names, key=lambda x: x.lower())
 
 # ✅ Use `def` for anything with control flow or multiple steps.
 
+# --------------------------------------------------------
+# ⚡ Going Further: Sorting Names Again and Again (and Beyond RAM)
+# --------------------------------------------------------
+
+# sorted(names, key=str.lower) calls the key once per name — on *every* sort. If the list is re-sorted
+#      after each small change, all those keys (and the whole n·log n sort) are thrown away each time.
+# CollatedNames computes each key once and keeps the names in order as they're added (bisect),
+#      so "sorted again" is just a copy. save() writes "key\0name" lines: loading them back
+#      needs no key computation and no sorting.
+
+# The same file format makes an external merge sort easy: for a name file bigger than RAM,
+#      sort it in pieces that fit `memory_budget`, spill each sorted run to a temp file,
+#      then stream all runs through heapq.merge (which only holds one line per run in memory).
+
+import heapq
+import os
+
+class CollatedNames:
+    """Names kept in sort order, each sort key computed once."""
+
+    def __init__(self, names=(), *, key=str.lower):
+        self.key = key
+        self._keys, self._names = _sorted_by_key(list(names), key)
+
+    def add(self, name):
+        key = self.key(name)
+        at = bisect.bisect_right(self._keys, key)  # _right: after equal keys, so it stays stable
+        self._keys.insert(at, key)
+        self._names.insert(at, name)
+
+    def sorted(self):
+        return list(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+    def save(self, path):
+        """Write "key\0name" lines; the key function has to return str for that (str.lower, str.casefold ...)."""
+        with open(path, "w", encoding="utf-8") as file:
+            file.writelines(_collated_lines(self._keys, self._names))
+
+    @classmethod
+    def load(cls, path, *, key=str.lower):
+        """Read a file written by save() (with the same key function) — nothing is recomputed."""
+        collated = cls(key=key)
+        with open(path, encoding="utf-8") as file:
+            for line in file:
+                k, _, name = line[:-1].partition("\0")
+                collated._keys.append(k)
+                collated._names.append(name)
+        if collated._names and not isinstance(key(collated._names[0]), str):
+            raise TypeError("the saved keys are str, so key must return str too, or add() would mix types")
+        return collated
+
+def _sorted_by_key(names, key):
+    """(keys, names), both in sorted order — stable, like sorted(names, key=key)."""
+    keys = list(map(key, names))
+    order = sorted(range(len(keys)), key=keys.__getitem__)  # sorts small ints, no (key, name) tuples
+    return list(map(keys.__getitem__, order)), list(map(names.__getitem__, order))
+
+def _collated_lines(keys, names):
+    # Keys are written as text and later compared as text, so they must *be* text: a key like len
+    #      would be compared as "10" < "9" after a round trip. And "\0" / "\n" would break the format.
+    if not set(map(type, keys)) <= {str}:
+        raise TypeError("the sort key must return str (like str.lower) to be saved or sorted externally")
+    joined = "".join(keys)
+    if "\0" in joined or "\n" in joined:
+        raise ValueError("sort keys can't contain '\\0' or '\\n'")
+    return map("{}\0{}\n".format, keys, names)
+
+def _collated_key(line):
+    return line[:line.index("\0")]
+
+def external_sort(source, destination, *, key=str.lower, memory_budget=64 << 20, max_fan_in=64):
+    """Sort a file of names (one per line) into `destination`, holding roughly memory_budget bytes at a time.
+
+    Like sorted(names, key=key): stable, and names with equal keys keep their input order.
+    key has to return str: the runs on disk are compared as text.
+    """
+    import tempfile  # imported here, so importing this lesson stays cheap
+
+    with tempfile.TemporaryDirectory() as folder:
+        runs = _write_sorted_runs(source, folder, key, memory_budget)
+        while len(runs) > max_fan_in:  # too many files to keep open at once: merge in rounds
+            runs = [_merge_runs(runs[start:start + max_fan_in], folder)
+                    for start in range(0, len(runs), max_fan_in)]
+
+        files = [open(run, encoding="utf-8") for run in runs]
+        try:
+            with open(destination, "w", encoding="utf-8") as out:
+                merged = heapq.merge(*files, key=_collated_key)  # stable: ties come from earlier runs first
+                out.writelines(line[line.index("\0") + 1:] for line in merged)
+        finally:
+            for file in files:
+                file.close()
+
+# What one name costs while its run is being sorted: the name and its key (~50 bytes of str header each),
+#      a slot in three lists and an int in the sort order. An estimate: non-ASCII text takes more.
+_BYTES_PER_NAME = 176
+
+def _write_sorted_runs(source, folder, key, memory_budget):
+    runs = []
+    with open(source, encoding="utf-8") as file:
+        while True:
+            names, used = [], 0
+            while used < memory_budget and (lines := file.readlines(1 << 16)):  # ~64 KB of lines at a time
+                names += [line.rstrip("\n") for line in lines]
+                used += len(lines) * _BYTES_PER_NAME + 2 * sum(map(len, lines))
+            if not names:
+                return runs
+            run = os.path.join(folder, f"run-{len(runs)}")
+            with open(run, "w", encoding="utf-8") as out:
+                out.writelines(_collated_lines(*_sorted_by_key(names, key)))
+            runs.append(run)
+
+def _merge_runs(runs, folder):
+    files = [open(run, encoding="utf-8") for run in runs]
+    try:
+        merged = runs[0] + "+"
+        with open(merged, "w", encoding="utf-8") as out:
+            out.writelines(heapq.merge(*files, key=_collated_key))
+    finally:
+        for file in files:
+            file.close()
+    for run in runs:
+        os.remove(run)
+    return merged
+
+# names = CollatedNames(names)               # keys computed once
+# names.add("Zoe")                           # stays sorted
+# names.sorted()                             # a copy, no re-sort
+# external_sort("names.txt", "sorted.txt", memory_budget=256 << 20)
+
 # --------------------------------------------------------
 # 🧪 Recap: Pythonic function design
 # --------------------------------------------------------
@@ -218,3 +1005,375 @@ sorted(names, key=lambda x: x.lower())
 # - Bundle config into dicts or dataclasses
 # - Avoid deep nesting
 # - Use lambda sparingly — only when it truly helps
+
+# --------------------------------------------------------
+# ⏱️ Measuring it: a stand-in backend, in the same process
+# --------------------------------------------------------
+
+async def _stand_in_backend(reader, writer, *, request_numbers, fail_every=0):
+    """Answers GET /users/<name> with {"user": name} over keep-alive; every fail_every-th request gets a 503.
+
+    Users starting with "chunked-" get a chunked response; "hangup-" users get their answer,
+    then the connection is dropped without a word (like an idle timeout on a real server);
+    "silent-" users never get an answer: the backend just waits for the client to hang up.
+    """
+    import json
+    from urllib.parse import unquote
+
+    try:
+        while request_line := await reader.readline():
+            while await reader.readline() not in (b"\r\n", b""):
+                pass  # skip the request headers
+            user = unquote(request_line.split()[1].decode().rpartition("/")[2])
+            if user.startswith("silent-"):
+                await reader.read()  # returns once the client closes its end
+                break
+            if fail_every and next(request_numbers) % fail_every == 0:
+                status, body = "503 Service Unavailable", b"{}"
+            else:
+                status, body = "200 OK", json.dumps({"user": user}).encode()
+            if user.startswith("chunked-"):
+                half = len(body) // 2
+                writer.write(f"HTTP/1.1 {status}\r\nTransfer-Encoding: chunked\r\n\r\n".encode()
+                             + b"%x\r\n%s\r\n%x\r\n%s\r\n0\r\n\r\n" % (half, body[:half], len(body) - half, body[half:]))
+            else:
+                writer.write(f"HTTP/1.1 {status}\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+            await writer.drain()
+            if user.startswith("hangup-"):
+                break
+    finally:
+        writer.close()
+
+async def _benchmark_fetch_many(count, concurrency, fail_every):
+    import asyncio
+    import functools
+    import itertools
+    import time
+
+    handler = functools.partial(_stand_in_backend, request_numbers=itertools.count(1), fail_every=fail_every)
+    server = await asyncio.start_server(handler, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    api = UserAPI("127.0.0.1", port, pool_size=concurrency)
+    users = [f"user{i}" for i in range(count)]
+
+    # Correctness first: every user comes back, in order, even with a flaky backend (retry=True)
+    results = await api.fetch_many(users, concurrency=concurrency)
+    assert [result["user"] for result in results] == users
+    assert (await api.fetch_data("adrian", raw=True)) == b'{"user": "adrian"}'
+    for user in ("chunked-adrian", "a b/c\r\nX: y", "hangup-adrian", "after-hangup"):
+        # names are URL-quoted; chunked bodies are read; a dropped keep-alive connection is replaced
+        assert (await api.fetch_data(user, retry=False)) == {"user": user}
+
+    # Cancelled mid-request (here by a timeout): the half-used connection is closed, not leaked
+    idle_before = {writer for _, writer in api._pool._idle}
+    try:
+        await asyncio.wait_for(api.fetch_data("silent-adrian"), 0.05)
+    except asyncio.TimeoutError:
+        pass
+    taken = idle_before - {writer for _, writer in api._pool._idle}
+    assert taken and all(writer.is_closing() for writer in taken)
+
+    latencies = []
+    limit = asyncio.Semaphore(concurrency)
+
+    async def timed(user):
+        async with limit:
+            start = time.perf_counter()
+            await api.fetch_data(user)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*map(timed, users))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    print(f"fetch_many: {count:,} users, concurrency {concurrency}: {count / elapsed:,.0f} requests/sec,"
+          f" p50 {latencies[len(latencies) // 2] * 1000:.2f} ms, p99 {latencies[int(len(latencies) * 0.99)] * 1000:.2f} ms")
+
+    await api.close()
+    server.close()
+    await server.wait_closed()
+
+def benchmark_fetch_many(count=10_000, concurrency=32, fail_every=100):
+    import asyncio
+
+    asyncio.run(_benchmark_fetch_many(count, concurrency, fail_every))
+
+def _open_sqlite(cfg):
+    import sqlite3
+
+    return sqlite3.connect(cfg.host, timeout=cfg.timeout, check_same_thread=False)
+
+def benchmark_connection_pool(acquires=100_000, fresh_connects=5_000):
+    import os
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as folder:
+        cfg = DBConfig(host=os.path.join(folder, "bench.db"), port=0, user="", password="", timeout=1)
+        _open_sqlite(cfg).close()  # create the database file
+
+        start = time.perf_counter()
+        for _ in range(fresh_connects):
+            connection = _open_sqlite(cfg)
+            connection.execute("SELECT 1")
+            connection.close()
+        fresh = (time.perf_counter() - start) / fresh_connects
+
+        pool = get_pool(cfg, _open_sqlite, max_size=2)
+        assert get_pool(DBConfig(**dataclasses.asdict(cfg)), _open_sqlite) is pool  # equal config, same pool
+        start = time.perf_counter()
+        for _ in range(acquires):
+            with pool.acquire() as connection:
+                connection.execute("SELECT 1")
+        pooled = (time.perf_counter() - start) / acquires
+
+        # A failing block rolls back: the next borrower doesn't see its uncommitted rows
+        with pool.acquire() as connection:
+            connection.execute("CREATE TABLE IF NOT EXISTS seen (n)")
+            connection.commit()
+        try:
+            with pool.acquire() as connection:
+                connection.execute("INSERT INTO seen VALUES (1)")
+                raise KeyError("something went wrong mid-transaction")
+        except KeyError:
+            pass
+        with pool.acquire() as connection:
+            assert not connection.in_transaction
+            assert connection.execute("SELECT count(*) FROM seen").fetchone() == (0,)
+
+        # Exhausted pool: the third caller waits cfg.timeout, then gets PoolTimeout
+        with pool.acquire(), pool.acquire():
+            try:
+                with pool.acquire():
+                    pass
+            except PoolTimeout:
+                pass
+            else:
+                raise AssertionError("expected PoolTimeout")
+        pool.close()
+
+    print(f"connect per query: {fresh * 1e6:8.1f} µs/query ({fresh_connects:,} queries)")
+    print(f"pooled acquire:    {pooled * 1e6:8.1f} µs/query ({acquires:,} queries, 1 connect amortized over all)")
+
+def benchmark_readiness(count=20, latency=0.05):
+    def slow_check(result=True):
+        def probe():
+            time.sleep(latency)  # stands in for a network round trip
+            return result
+        return probe
+
+    probes = [slow_check() for _ in range(count)]
+    start = time.perf_counter()
+    assert all(probe() for probe in probes)
+    serial = time.perf_counter() - start
+
+    checks = ReadinessChecks()
+    for number, probe in enumerate(probes):
+        checks.register(probe, ttl=60.0, name=f"probe-{number}")
+    start = time.perf_counter()
+    assert checks.is_ready()
+    concurrent = time.perf_counter() - start
+    start = time.perf_counter()
+    assert checks.is_ready()
+    cached = time.perf_counter() - start
+    checks.close()
+
+    # One fast failure among slow checks: the answer comes before the slow ones finish
+    failing = ReadinessChecks(max_workers=4)
+    failing.register(lambda: False, name="broken")
+    for number in range(count):
+        failing.register(slow_check(), name=f"probe-{number}")
+    start = time.perf_counter()
+    assert not failing.is_ready()
+    failed = time.perf_counter() - start
+    failing.close()
+
+    print(f"{count} checks of {latency * 1000:.0f} ms each:")
+    print(f"  serial:                    {serial * 1000:7.1f} ms")
+    print(f"  ReadinessChecks:           {concurrent * 1000:7.1f} ms ({serial / concurrent:.1f}x faster)")
+    print(f"  ReadinessChecks, cached:   {cached * 1000:7.3f} ms")
+    print(f"  one failing, 4 workers:    {failed * 1000:7.1f} ms (queued checks cancelled)")
+
+def benchmark_sorting(count=1_000_000, rounds=20, added=100, file_names=2_000_000, memory_budget=16 << 20):
+    import random
+    import string
+    import tempfile
+    import tracemalloc
+
+    def random_name():
+        return random.choice(string.ascii_letters) + "".join(random.choices(string.ascii_lowercase, k=7))
+
+    base = [random_name() for _ in range(count)]
+    batches = [[random_name() for _ in range(added)] for _ in range(rounds)]
+
+    current = list(base)
+    start = time.perf_counter()
+    for batch in batches:
+        current.extend(batch)
+        result = sorted(current, key=str.lower)
+    resort = (time.perf_counter() - start) / rounds
+
+    start = time.perf_counter()
+    collated = CollatedNames(base)
+    first = time.perf_counter() - start
+    start = time.perf_counter()
+    for batch in batches:
+        for name in batch:
+            collated.add(name)
+        collated_result = collated.sorted()
+    incremental = (time.perf_counter() - start) / rounds
+    assert collated_result == result
+
+    print(f"re-sort {count:,} names after adding {added} ({rounds} rounds):")
+    print(f"  sorted(names, key=str.lower):  {resort * 1000:8.1f} ms per round")
+    print(f"  CollatedNames add + sorted():  {incremental * 1000:8.1f} ms per round"
+          f" ({resort / incremental:.0f}x faster, after a one-time {first * 1000:.0f} ms build)")
+
+    with tempfile.TemporaryDirectory() as folder:
+        saved = os.path.join(folder, "collated.txt")
+        collated.save(saved)
+        start = time.perf_counter()
+        assert CollatedNames.load(saved).sorted() == result
+        print(f"  CollatedNames.load() of the saved keys:  {(time.perf_counter() - start) * 1000:8.1f} ms")
+
+        source, destination = os.path.join(folder, "names.txt"), os.path.join(folder, "sorted.txt")
+        names = [random_name() for _ in range(file_names)]
+        with open(source, "w", encoding="utf-8") as file:
+            file.writelines(name + "\n" for name in names)
+        start = time.perf_counter()
+        external_sort(source, destination, memory_budget=memory_budget)
+        elapsed = time.perf_counter() - start
+        try:
+            external_sort(source, destination, key=len, memory_budget=memory_budget)
+        except TypeError:
+            pass  # non-str keys would be merged in the wrong order, so they're refused
+        else:
+            raise AssertionError("expected TypeError for key=len")
+        with open(destination, encoding="utf-8") as file:
+            assert file.read().splitlines() == sorted(names, key=str.lower)
+        size_mb = os.path.getsize(source) / 1e6
+        print(f"external_sort: {file_names:,} names ({size_mb:.0f} MB) in {elapsed:.2f}s,"
+              f" {memory_budget >> 20} MB budget")
+
+        # tracemalloc slows everything down, so the memory check uses a smaller file and budget
+        with open(source, "w", encoding="utf-8") as file:
+            file.writelines(name + "\n" for name in names[:file_names // 10])
+        for budget in (memory_budget // 8, memory_budget // 2):
+            tracemalloc.start()
+            external_sort(source, destination, memory_budget=budget)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"  {file_names // 10:,} names, {budget / 2**20:.0f} MB budget: peak Python memory {peak / 2**20:.1f} MB")
+
+def benchmark_prefix_classifier(count=200_000, sizes=(10, 100, 1_000, 10_000, 100_000)):
+    import random
+
+    def host(number):
+        return f"{random.choice(('http', 'https'))}://{random.choice(('api', 'www', 'cdn'))}{number}.example.com/"
+
+    print(f"{'prefixes':>10} {'PrefixClassifier':>18} {'startswith(tuple)':>19} {'startswith loop':>17}   (lookups/s)")
+    for size in sizes:
+        tags = {host(number): f"route-{number % 10}" for number in range(size)}
+        for prefix in random.sample(list(tags), size // 10):  # some nested, longer prefixes
+            tags[prefix + "v2/"] = "v2"
+        hosts = list(tags)
+        urls = [random.choice(hosts) + "v2/users/42" if random.random() < 0.5 else host(size + number)
+                for number in range(count)]  # about half of them hit
+
+        classifier = PrefixClassifier(tags)
+        start = time.perf_counter()
+        routed = list(classifier.tag_all(urls))
+        compiled = count / (time.perf_counter() - start)
+
+        def longest(url):
+            matches = [prefix for prefix in tags if url.startswith(prefix)]
+            return tags[max(matches, key=len)] if matches else None
+
+        sample = urls[:max(10, 2_000_000 // size)]  # the O(prefixes) baselines get fewer urls
+        assert [tag for _, tag in routed[:len(sample)]] == list(map(longest, sample))
+        as_tuple = tuple(tags)
+        start = time.perf_counter()
+        for url in sample:
+            url.startswith(as_tuple)  # in C, but only says *whether* something matched, not what
+        any_match = len(sample) / (time.perf_counter() - start)
+        start = time.perf_counter()
+        for url in sample:
+            longest(url)
+        loop = len(sample) / (time.perf_counter() - start)
+
+        print(f"{len(tags):>10,} {compiled:>18,.0f} {any_match:>19,.0f} {loop:>17,.0f}")
+
+    # "No match" is None, so falsy tags still count
+    falsy = PrefixClassifier({"a": 0, "b": "", "c": None})
+    assert list(falsy.filter(["a1", "b1", "c1", "d1"])) == ["a1", "b1"]
+    assert list(falsy.filter(["a1", "b1"], 0)) == ["a1"]
+
+def check_running_stats(count=1_000_000):
+    import random
+    import statistics
+
+    numbers = [random.gauss(1e6, 3.0) for _ in range(count)]  # big mean, tiny spread: hard for naive formulas
+    whole = RunningStats(iter(numbers))
+    parts = [RunningStats(numbers[start:start + 100_000]) for start in range(0, count, 100_000)]
+    merged = RunningStats()
+    for part in parts:
+        merged.merge(part)
+    for stats in (whole, merged):
+        assert stats.count == count and (stats.min, stats.max) == (min(numbers), max(numbers))
+        assert math.isclose(stats.mean, statistics.fmean(numbers), rel_tol=1e-12)
+        assert math.isclose(stats.variance, statistics.variance(numbers), rel_tol=1e-9)
+    assert get_bounds(iter(numbers)) == get_bounds(numbers)
+    assert get_bounds({"b", "a"}) == get_bounds(iter(["b", "a"])) == ("a", "b")  # not just numbers
+    print(whole)
+
+def benchmark_normalize_score_file(count=10_000_000):
+    import os
+    import random
+    import tempfile
+    import tracemalloc
+    from array import array
+
+    def write_scores(count):
+        with tempfile.NamedTemporaryFile(suffix=".f64", delete=False) as file:
+            for _ in range(count // len(sample)):
+                array("d", sample).tofile(file)
+        return file.name
+
+    sample = [random.uniform(-50, 150) for _ in range(1000)]
+    path = write_scores(count)
+    try:
+        for method in ("minmax", "zscore"):
+            start = time.perf_counter()
+            normalize_score_file(path, method=method)
+            elapsed = time.perf_counter() - start
+
+            with open(path, "rb") as result:
+                head = array("d", result.read(len(sample) * 8))
+            expected = get_normalized_scores(sample, method=method)
+            assert get_normalized_scores((score for score in sample), method=method) == expected
+            assert all(math.isclose(a, b, abs_tol=1e-9) for a, b in zip(head, expected))
+            sample = expected  # the file now holds the normalized values, the next method starts from those
+            print(f"normalize_score_file({method}): {os.path.getsize(path) / 1e6:,.0f} MB in {elapsed:.2f}s")
+    finally:
+        os.remove(path)
+
+    # tracemalloc slows every allocation down a lot, so peak memory gets its own (smaller and larger) runs:
+    # it should depend on chunk_items only, not on the size of the file
+    for count in (count // 100, count // 10):
+        path = write_scores(count)
+        try:
+            tracemalloc.start()
+            normalize_score_file(path)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"  {os.path.getsize(path) / 1e6:,.0f} MB file: peak Python memory {peak / 1e6:.1f} MB")
+        finally:
+            os.remove(path)
+
+if __name__ == "__main__":
+    benchmark_fetch_many()
+    benchmark_connection_pool()
+    benchmark_readiness()
+    benchmark_sorting()
+    benchmark_prefix_classifier()
+    check_running_stats()
+    benchmark_normalize_score_file()
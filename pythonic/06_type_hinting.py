@@ -31,6 +31,55 @@ def process_names(names: List[str]) -> List[str]:
 # This is a common pattern when working with collections.
 # Here, `List[str]` tells us the function expects a list of strings.
 
+# --------------------------------------------------------
+# ⚡ Going Further: 200 Million Names Don't Fit in a List
+# --------------------------------------------------------
+
+# process_names() needs the whole input list *and* builds a whole output list next to it.
+# iter_process_names() takes any iterable (a file, a database cursor ...) and yields one processed
+#      chunk at a time, so only one chunk of names is in memory, however long the input is.
+
+# process_names_parallel() hands the chunks to worker processes. Two details keep it well-behaved:
+# - order: chunks come back in input order, even when a later one finishes first
+# - bounded: at most `max_in_flight` chunks are out at once, so a fast reader can't pile up
+#      the whole input in the pool's queue while the workers (or the consumer) fall behind
+# Fair warning: every chunk is pickled to a worker and back. For something as cheap as .upper()
+#      that copying costs more than the work — processes pay off when each name needs real work.
+
+import os
+from collections import deque
+from itertools import islice
+from typing import Iterable, Iterator, Optional
+
+def iter_process_names(names: Iterable[str], *, chunk_size: int = 65_536) -> Iterator[List[str]]:
+    """process_names(), one chunk of at most chunk_size names at a time."""
+    names = iter(names)
+    while chunk := list(islice(names, chunk_size)):
+        yield process_names(chunk)
+
+def process_names_parallel(names: Iterable[str], *, workers: Optional[int] = None, chunk_size: int = 65_536,
+                           max_in_flight: Optional[int] = None) -> Iterator[List[str]]:
+    """iter_process_names() on a process pool: same chunks, same order, at most max_in_flight (default 2 * workers) at once."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or 2 * workers
+    pool = ProcessPoolExecutor(max_workers=workers)
+    pending = deque()
+    names = iter(names)
+    try:
+        while chunk := list(islice(names, chunk_size)):
+            pending.append(pool.submit(process_names, chunk))
+            if len(pending) >= max_in_flight:
+                yield pending.popleft().result()  # the oldest chunk: keeps the order
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        pool.shutdown(cancel_futures=True)  # also when the caller stops iterating early
+
+# for chunk in process_names_parallel(open("names.txt"), workers=8):
+#     output.writelines(chunk)
+
 def get_user_info(user_id: int) -> Dict[str, str]:
     # The return type is a dictionary with keys and values as strings
     return {"user_id": str(user_id), "username": "blahblah123"}
@@ -57,6 +106,115 @@ def get_optional_value(val: Optional[int]) -> int:
     # If None, we return a default value of 0.
     return val if val is not None else 0
 
+# --------------------------------------------------------
+# ⚡ Going Further: Parsing a Whole Column at Once
+# --------------------------------------------------------
+
+# parse_value() is fine for one value. For a column of millions, it costs per value:
+# - a temporary string from val.replace('.', '', 1) (for every non-integer)
+# - a boxed int or float in the result list (~28-32 bytes each, plus an 8 byte list slot)
+#      — and None for the bad ones, so the caller has to check every single item again.
+
+# parse_column() works a chunk at a time instead. One isdigit() on the joined chunk answers
+#      "are these all integers?"; if so, map(int, chunk) runs in C straight into an array('q').
+#      Only the values that aren't plain digits get looked at one by one.
+# The result is a typed array (8 bytes per value, ready for numpy.frombuffer or the struct module)
+#      plus a null mask: 1 where parse_value() would have returned None.
+
+# Same rules as parse_value(): digits, optionally with one '.', no sign, no exponent, no spaces.
+
+import re
+from array import array
+from itertools import compress
+from typing import IO, NamedTuple
+
+_IS_FLOAT = re.compile(r"\d+\.\d*|\.\d+").fullmatch  # "1.5", "5." and ".5" — like parse_value(), but not "."
+
+class ParsedColumn(NamedTuple):
+    values: array     # array('q') if every value was an int, else array('d'); 0 where the value is null
+    nulls: bytearray  # 1 where parse_value() would have returned None
+
+def parse_column(values: Iterable[str], *, chunk_size: int = 4096) -> ParsedColumn:
+    """parse_value() for a whole column: ints stay array('q') until the first float turns it into array('d').
+
+    Integers that don't fit in 64 bits raise OverflowError, like array('q') itself.
+    """
+    column = ParsedColumn(array("q"), bytearray())
+    values = iter(values)
+    while chunk := list(islice(values, chunk_size)):
+        column = _parse_chunk(column, chunk)
+    return column
+
+def parse_column_file(file: IO[str], *, chunk_size: int = 1 << 16) -> ParsedColumn:
+    """parse_column() for a file with one value per line (e.g. a column exported from a database)."""
+    column = ParsedColumn(array("q"), bytearray())
+    rest = ""
+    while text := file.read(chunk_size):
+        lines = (rest + text).split("\n")
+        rest = lines.pop()  # the last line may continue in the next read
+        if lines:
+            column = _parse_chunk(column, lines)
+    if rest:
+        column = _parse_chunk(column, [rest])
+    return column
+
+def _parse_chunk(column: ParsedColumn, chunk: List[str]) -> ParsedColumn:
+    # One check for the whole chunk: only digits (and dots)? Then int() / float() can take it from here,
+    #      they reject the rest themselves ("", ".", "1.2.3" raise ValueError).
+    joined = "".join(chunk)
+    parsed = None
+    try:
+        if "." not in joined:
+            if joined.isdigit():
+                parsed = array(column.values.typecode, map(int, chunk))  # stays 'd' once a float was seen
+        elif joined.replace(".", "").isdigit():
+            parsed = array("d", map(float, chunk))
+            column = _as_floats(column)
+    except ValueError:
+        pass
+    if parsed is not None:
+        column.values.extend(parsed)
+        column.nulls.extend(bytes(len(chunk)))
+        return column
+
+    start = len(column.values)
+    try:
+        # Some bad values: look only at the ones that aren't plain ints, and put a "0" in place of the bad ones
+        nulls = bytearray(len(chunk))
+        patched, floats = list(chunk), False
+        for i in compress(range(len(chunk)), map(operator.not_, map(str.isdigit, chunk))):
+            if _IS_FLOAT(chunk[i]):
+                floats = True
+            else:
+                nulls[i] = 1
+                patched[i] = "0"
+        if floats:
+            column = _as_floats(column)
+        column.values.extend(map(float if floats else int, patched))
+        column.nulls.extend(nulls)
+        return column
+    except ValueError:  # isdigit() is True for "²" or "½" too, but int() can't read them
+        del column.values[start:]
+    for value in chunk:  # the slow way, one value at a time
+        try:
+            parsed = parse_value(value)
+        except ValueError:
+            parsed = None
+        if isinstance(parsed, float):
+            column = _as_floats(column)
+        column.values.append(0 if parsed is None else parsed)
+        column.nulls.append(parsed is None)
+    return column
+
+def _as_floats(column: ParsedColumn) -> ParsedColumn:
+    if column.values.typecode == "d":
+        return column
+    return ParsedColumn(array("d", column.values), column.nulls)
+
+# column = parse_column(["12", "3.5", "n/a"])
+# column.values  -> array('d', [12.0, 3.5, 0.0])
+# column.nulls   -> bytearray(b'\x00\x00\x01')
+
 # --------------------------------------------------------
 # ✅ Type Hinting for Functions that Return Multiple Values
 # --------------------------------------------------------
@@ -71,7 +229,8 @@ def get_coordinates() -> Tuple[int, int]:
     return (10, 20)
 
 x, y = get_coordinates()
-print(x, y)
+if __name__ == "__main__":  # only when run as a script, importing stays silent (see 08_a_polite_suggestion.py)
+    print(x, y)
 
 # --------------------------------------------------------
 # ✅ Advanced: Callable (Function as a Type)
@@ -80,6 +239,8 @@ print(x, y)
 # You can even use type hints for functions that accept or return other functions.
 # Here's an example of a function that takes another function as an argument.
 
+import itertools
+import operator
 from typing import Callable
 
 def run_operation(op: Callable[[int, int], int], x: int, y: int) -> int:
@@ -92,7 +253,118 @@ def add(x: int, y: int) -> int:
     return x + y
 
 result = run_operation(add, 3, 4)
-print(result)  # <- Output: 7
+if __name__ == "__main__":
+    print(result)  # <- Output: 7
+
+# --------------------------------------------------------
+# ⚡ Going Further: run_operation() on a Million Pairs
+# --------------------------------------------------------
+
+# Calling run_operation() in a loop pays Python's call overhead twice per pair (run_operation, then op).
+# run_operations() takes two whole sequences and picks the cheapest way to combine them:
+# - op is a numpy ufunc (numpy.add ...), or operator.add & co. on numpy arrays: one vectorized call
+# - anything else: map(op, xs, ys). For builtins like operator.add, map() never leaves C at all
+# - executor="thread" / "process" (or your own Executor): chunks run in a pool, for *expensive* ops —
+#      threads when op waits (I/O) or releases the GIL, processes when it's pure Python number crunching
+
+# Chunk size is tuned automatically: op is timed on the first few pairs (their results are kept,
+#      op never runs twice on the same pair), and each chunk gets enough
+#      pairs for ~10 ms of work — so the pool's per-task overhead stays small — but there are still
+#      a few chunks per worker, so no worker sits idle at the end.
+
+import functools
+import os
+import time
+from typing import Any, Sequence
+
+# operator functions that have an exact numpy twin
+_UFUNC_NAMES = {
+    operator.add: "add", operator.sub: "subtract", operator.mul: "multiply", operator.truediv: "true_divide",
+    operator.floordiv: "floor_divide", operator.mod: "remainder", operator.pow: "power",
+    operator.and_: "bitwise_and", operator.or_: "bitwise_or", operator.xor: "bitwise_xor",
+}
+
+CHUNK_SECONDS = 0.01  # target work per chunk in a pool
+
+@functools.lru_cache(maxsize=None)
+def _numpy():
+    """Import numpy on first use, or None if it isn't installed."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+def run_operations(op: Callable[[int, int], int], xs: Sequence[int], ys: Sequence[int], *,
+                   executor: Any = None, workers: Optional[int] = None, chunk_size: Optional[int] = None) -> Sequence[int]:
+    """[op(x, y) for x, y in zip(xs, ys)], vectorized or in a pool when that's faster.
+
+    Returns a numpy array when numpy did the work, a list otherwise.
+    executor: None, "thread", "process" or a concurrent.futures.Executor (then pass workers= too,
+    so the chunk size can be tuned to it). With "process", op must be picklable (a module-level function, not a lambda).
+    """
+    if len(xs) != len(ys):
+        raise ValueError(f"xs and ys differ in length: {len(xs)} != {len(ys)}")
+
+    if _from_numpy(op) or _from_numpy(xs):  # only then is numpy worth importing
+        np = _numpy()
+        if isinstance(op, np.ufunc):
+            return op(np.asarray(xs), np.asarray(ys))
+        if op in _UFUNC_NAMES and isinstance(xs, np.ndarray) and isinstance(ys, np.ndarray):
+            return getattr(np, _UFUNC_NAMES[op])(xs, ys)
+
+    if executor is None:
+        return list(map(op, xs, ys))
+    return _run_in_pool(op, xs, ys, executor, workers, chunk_size)
+
+def _from_numpy(obj: Any) -> bool:
+    return type(obj).__module__ == "numpy"  # numpy.ufunc, numpy.ndarray
+
+def _run_in_pool(op, xs, ys, executor, workers, chunk_size):
+    from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+    if isinstance(executor, Executor):
+        if workers is None:
+            raise TypeError("pass workers= with an Executor instance: how many workers it has")
+        pool, owned = executor, False
+    elif executor in ("thread", "process"):
+        workers = workers or (min(32, (os.cpu_count() or 1) + 4) if executor == "thread" else os.cpu_count() or 1)
+        pool, owned = (ThreadPoolExecutor if executor == "thread" else ProcessPoolExecutor)(workers), True
+    else:
+        raise ValueError(f"executor must be None, 'thread', 'process' or an Executor, not {executor!r}")
+
+    try:
+        results = []
+        if chunk_size is None:
+            results, chunk_size = _tune_chunk_size(op, xs, ys, workers)
+        starts = range(len(results), len(xs), chunk_size)  # the pairs timed while tuning are done already
+        chunks = pool.map(_apply_chunk, itertools.repeat(op),
+                          (xs[start:start + chunk_size] for start in starts),
+                          (ys[start:start + chunk_size] for start in starts))
+        results.extend(itertools.chain.from_iterable(chunks))  # pool.map keeps the input order
+        return results
+    finally:
+        if owned:
+            pool.shutdown()
+
+def _apply_chunk(op, xs, ys):
+    return list(map(op, xs, ys))
+
+def _tune_chunk_size(op, xs, ys, workers, sample=16):
+    """(results for the first `sample` pairs, chunk size): enough pairs per chunk for CHUNK_SECONDS of work,
+    but at least 4 chunks per worker."""
+    sample = min(sample, len(xs))
+    start = time.perf_counter()
+    results = _apply_chunk(op, xs[:sample], ys[:sample])
+    per_pair = (time.perf_counter() - start) / max(sample, 1)
+    rest = len(xs) - sample
+    by_time = int(CHUNK_SECONDS / per_pair) if per_pair else rest
+    by_balance = -(-rest // (workers * 4))  # ceil
+    return results, max(1, min(by_time, by_balance))
+
+# run_operations(add, [1, 2, 3], [10, 20, 30])              -> [11, 22, 33]
+# run_operations(operator.add, xs, ys)                      -> map() in C, or numpy if xs/ys are arrays
+# run_operations(fetch_exchange_rate, xs, ys, executor="thread")
 
 # --------------------------------------------------------
 # ✅ Type Aliases: Making Complex Types Easier to Read
@@ -127,4 +399,139 @@ def get_user_data() -> UserData:
 # - Use type hints for clarity: functions, parameters, return values.
 # - Use `List`, `Dict`, `Tuple`, `Union`, `Optional` for complex types.
 # - Avoid overuse — type hints should enhance, not complicate.
-# - Type hints are optional, but they add a lot of value when used properly.
\ No newline at end of file
+# - Type hints are optional, but they add a lot of value when used properly.
+
+# --------------------------------------------------------
+# ⏱️ Measuring it
+# --------------------------------------------------------
+
+def benchmark_parse_column(count: int = 1_000_000) -> None:
+    import io
+    import random
+    import sys
+    import timeit
+
+    columns = {
+        "ints": [str(random.randrange(10**9)) for _ in range(count)],
+        "floats": [f"{random.uniform(0, 1e6):.3f}" for _ in range(count)],
+        "ints, 1% bad": [str(random.randrange(10**9)) if random.random() > 0.01 else "n/a" for _ in range(count)],
+    }
+    print(f"{count:,} values          list(map(parse_value))     parse_column   parse_column_file")
+    for name, values in columns.items():
+        boxed = list(map(parse_value, values))
+        column = parse_column(values)
+        assert [None if null else value for value, null in zip(column.values, column.nulls)] == boxed
+        text = "\n".join(values)
+        assert parse_column_file(io.StringIO(text)) == column
+        mixed = ["1.5"] + values  # a float first: every later (integer) chunk must become floats too
+        assert list(parse_column(mixed).values[1:]) == [float(value) for value in column.values]
+        assert parse_column_file(io.StringIO("\n".join(mixed))) == parse_column(mixed)
+
+        best = lambda run: min(timeit.repeat(run, number=1, repeat=3))
+        one_by_one = best(lambda: list(map(parse_value, values)))
+        batched = best(lambda: parse_column(values))
+        from_file = best(lambda: parse_column_file(io.StringIO(text)))
+
+        print(f"{name:<18} {one_by_one * 1000:>18.0f} ms {batched * 1000:>13.0f} ms"
+              f" ({one_by_one / batched:.1f}x) {from_file * 1000:>10.0f} ms")
+
+    boxed_bytes = sys.getsizeof(boxed) + sum(sys.getsizeof(value) for value in boxed if value is not None)
+    column_bytes = sys.getsizeof(column.values) + sys.getsizeof(column.nulls)
+    print(f"result size: list {boxed_bytes / 1e6:.1f} MB, array + null mask {column_bytes / 1e6:.1f} MB")
+
+def benchmark_run_operations(count: int = 1_000_000) -> None:
+    import random
+    import timeit
+
+    xs = [random.randrange(1000) for _ in range(count)]
+    ys = [random.randrange(1000) for _ in range(count)]
+    expected = [x + y for x, y in zip(xs, ys)]
+    best = lambda run: min(timeit.repeat(run, number=1, repeat=3))
+
+    timings = {
+        "loop over run_operation(add)": best(lambda: [run_operation(add, x, y) for x, y in zip(xs, ys)]),
+        "run_operations(add)": best(lambda: run_operations(add, xs, ys)),
+        "run_operations(operator.add)": best(lambda: run_operations(operator.add, xs, ys)),
+    }
+    assert run_operations(add, xs, ys) == run_operations(operator.add, xs, ys) == expected
+    np = _numpy()
+    if np is not None:
+        xs_array, ys_array = np.asarray(xs), np.asarray(ys)
+        timings["run_operations(operator.add), numpy arrays"] = best(lambda: run_operations(operator.add, xs_array, ys_array))
+        assert run_operations(operator.add, xs_array, ys_array).tolist() == expected
+    print(f"{count:,} pairs:")
+    for name, seconds in timings.items():
+        print(f"  {name:<44} {seconds * 1000:8.1f} ms")
+    if np is None:
+        print("  numpy isn't installed, skipped the vectorized path")
+
+    # Each pair goes through op exactly once, also the ones timed to pick the chunk size
+    calls = []
+    counted = lambda x, y: calls.append((x, y)) or x + y
+    assert run_operations(counted, xs[:40], ys[:40], executor="thread") == expected[:40] and len(calls) == 40
+
+    # Expensive ops: 2,000 pairs at ~1 ms each. Threads help when op waits, processes when it computes.
+    small = count // 500
+    for name, op in (("waits 1 ms", _slow_io_op), ("computes ~1 ms", _slow_cpu_op)):
+        serial = best(lambda: run_operations(op, xs[:small], ys[:small]))
+        line = f"  {small:,} pairs, op {name}: serial {serial:.2f}s"
+        for executor in ("thread", "process"):
+            elapsed = best(lambda: run_operations(op, xs[:small], ys[:small], executor=executor))
+            line += f", {executor} pool {elapsed:.2f}s"
+        print(line + f"  ({os.cpu_count()} cpu)")
+
+def _slow_io_op(x: int, y: int) -> int:
+    time.sleep(0.001)  # a network call, a disk read ...
+    return x + y
+
+def _slow_cpu_op(x: int, y: int) -> int:
+    total = 0
+    for i in range(10_000):
+        total += i % 7
+    return x + y + total - total
+
+def benchmark_process_names(count: int = 2_000_000, chunk_size: int = 65_536) -> None:
+    import itertools
+    import os
+    import time
+    import tracemalloc
+
+    def names() -> Iterator[str]:
+        return (f"name-{number}" for number in range(count))
+
+    start = time.perf_counter()
+    expected = process_names(list(names()))
+    print(f"{count:,} names: process_names(list) {time.perf_counter() - start:.2f}s")
+    start = time.perf_counter()
+    assert list(itertools.chain.from_iterable(iter_process_names(names(), chunk_size=chunk_size))) == expected
+    print(f"  iter_process_names:             {time.perf_counter() - start:.2f}s")
+    for workers in (1, 2, 4, 8, 16, 32):
+        start = time.perf_counter()
+        chunks = process_names_parallel(names(), workers=workers, chunk_size=chunk_size)
+        assert list(itertools.chain.from_iterable(chunks)) == expected
+        print(f"  process_names_parallel({workers:>2}):     {time.perf_counter() - start:.2f}s")
+    print(f"  ({os.cpu_count()} cpu here: more workers than cores only adds overhead)")
+    del expected
+
+    # Memory: the whole list at once vs one chunk at a time (a smaller run, tracemalloc is slow)
+    count //= 4
+    chunk_size //= 8
+    tracemalloc.start()
+    process_names(list(names()))
+    whole = tracemalloc.get_traced_memory()[1]
+    tracemalloc.reset_peak()
+    for _ in iter_process_names(names(), chunk_size=chunk_size):
+        pass
+    streamed = tracemalloc.get_traced_memory()[1]
+    tracemalloc.reset_peak()
+    for _ in process_names_parallel(names(), workers=4, chunk_size=chunk_size):
+        pass
+    parallel = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"  peak memory for {count:,} names ({chunk_size:,} per chunk): whole list {whole / 1e6:.1f} MB,"
+          f" streamed {streamed / 1e6:.1f} MB, parallel (4 workers, 8 in flight) {parallel / 1e6:.1f} MB")
+
+if __name__ == "__main__":
+    benchmark_parse_column()
+    benchmark_run_operations()
+    benchmark_process_names()
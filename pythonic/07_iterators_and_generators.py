@@ -24,8 +24,9 @@ def square_numbers(n: int):
 squares = square_numbers(5)
 
 # Iterate over the generator:
-for square in squares:
-    print(square)
+if __name__ == "__main__":  # only when run as a script, importing stays silent (see 08_a_polite_suggestion.py)
+    for square in squares:
+        print(square)
 
 # Output:
 # 0
@@ -62,8 +63,9 @@ def count_up_to(max: int):
 counter = count_up_to(5)
 
 # Iterate over the generator:
-for num in counter:
-    print(num)
+if __name__ == "__main__":
+    for num in counter:
+        print(num)
 
 # Output:
 # 1
@@ -83,8 +85,9 @@ for num in counter:
 gen = (x ** 2 for x in range(5))
 
 # This doesn't create a list; instead, it returns a generator that we can iterate over:
-for value in gen:
-    print(value)
+if __name__ == "__main__":
+    for value in gen:
+        print(value)
 
 # Output:
 # 0
@@ -105,8 +108,9 @@ import itertools
 # Use itertools.count() to create an infinite sequence of numbers
 counter = itertools.count(10, 5)  # Starts at 10, increments by 5
 
-for _ in range(5):  # Print the first 5 values
-    print(next(counter))
+if __name__ == "__main__":
+    for _ in range(5):  # Print the first 5 values
+        print(next(counter))
 
 # Output:
 # 10
@@ -134,6 +138,307 @@ def read_large_file(file_path: str):
 # for line in generator:
 #     print(line)
 
+# --------------------------------------------------------
+# ⚡ Going Further: Zero-Copy Lines with mmap
+# --------------------------------------------------------
+
+# read_large_file() is lazy, but every line still becomes a brand new (stripped) str object.
+# On multi-GB log files most of the time is spent decoding and copying bytes we might never look at.
+
+# mmap lets the OS map the file straight into memory. Slicing a memoryview over it
+#      gives us a "window" onto each line — no copy, no decode, until we actually ask for it.
+
+import mmap
+import os
+from typing import Optional
+
+def read_large_file_mmap(file_path: str, *, offsets: bool = False, encoding: Optional[str] = None):
+    """Yield each line of a file without copying it.
+
+    By default every line is a memoryview slice of the mapped file (line ending removed).
+    offsets=True yields (offset, length) pairs instead, encoding="utf-8" decodes each line to str.
+    """
+    with open(file_path, 'rb') as file:
+        size = os.fstat(file.fileno()).st_size
+        if size == 0:
+            return  # mmap refuses to map an empty file
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    view = memoryview(mapped)
+    try:
+        start = 0
+        while start < size:
+            stop = mapped.find(b'\n', start)
+            if stop == -1:
+                stop = size
+            end = stop
+            if end > start and mapped[end - 1] == 13:  # b'\r' from Windows line endings
+                end -= 1
+
+            if offsets:
+                yield start, end - start
+            elif encoding is not None:
+                yield str(view[start:end], encoding)
+            else:
+                yield view[start:end]
+            start = stop + 1
+    finally:
+        view.release()
+        try:
+            mapped.close()
+        except BufferError:
+            # The caller is still holding on to some of our slices,
+            # the mapping is freed as soon as the last one goes away.
+            pass
+
+# ⚠️ The memoryviews are only windows onto the file — use bytes(line) if you want to keep one around.
+# ⚠️ Unlike read_large_file(), only the line ending is removed, not surrounding whitespace.
+
+# for line in read_large_file_mmap('large_text_file.txt'):
+#     if line[:5] == b'ERROR':                     # compare bytes, no decoding needed
+#         print(str(line, 'utf-8'))
+
+# --------------------------------------------------------
+# ⏱️ Measuring it: lines/sec and peak memory
+# --------------------------------------------------------
+
+# Peak RSS only ever goes up within a process, so each reader gets its own child process.
+# Keep in mind: pages of the mapped file count towards RSS too, but they are clean page cache
+#      the OS can drop any time — unlike heap memory held by str objects.
+# And the per-line loop runs in Python rather than C, so the win shows up when you skip most lines
+#      (or only need offsets), not when you decode every single one anyway.
+
+import time
+import functools
+
+def _measure_reader(reader, file_path: str, results) -> None:
+    import resource  # Unix only
+
+    start = time.perf_counter()
+    count = sum(1 for _ in reader(file_path))
+    elapsed = time.perf_counter() - start
+    # ru_maxrss is in KiB on Linux (bytes on macOS)
+    results.put((count, count / elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss))
+
+def benchmark_read_large_file(file_path: str) -> None:
+    readers = {
+        "text (read_large_file)": read_large_file,
+        "mmap memoryview": read_large_file_mmap,
+        "mmap offsets": functools.partial(read_large_file_mmap, offsets=True),
+        "mmap + utf-8 decode": functools.partial(read_large_file_mmap, encoding='utf-8'),
+    }
+    import multiprocessing
+
+    for label, reader in readers.items():
+        results = multiprocessing.Queue()
+        worker = multiprocessing.Process(target=_measure_reader, args=(reader, file_path, results))
+        worker.start()
+        count, lines_per_sec, peak_rss = results.get()
+        worker.join()
+        print(f"{label:<24} {count:>10,} lines {lines_per_sec:>14,.0f} lines/sec   peak RSS {peak_rss:>9,} KiB")
+
+# --------------------------------------------------------
+# 🧩 Using Every Core: Map/Reduce over Byte Ranges
+# --------------------------------------------------------
+
+# A generator runs on one core. For really big files we can cut the file into byte ranges,
+#      let a pool of processes each run a function over "their" lines, and then combine the partial results.
+
+# The only tricky part: a range must never cut a line in half.
+# So we jump ahead roughly chunk_size bytes and then skip to the end of that line.
+
+import io
+import locale
+
+def _line_aligned_ranges(file_path: str, chunk_size: int):
+    size = os.path.getsize(file_path)
+    ranges = []
+    with open(file_path, 'rb') as file:
+        start = 0
+        while start < size:
+            file.seek(min(start + chunk_size, size))
+            file.readline()  # move on to the start of the next line
+            end = min(file.tell(), size)
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+def _map_range(file_path: str, start: int, end: int, mapper, encoding: str):
+    with open(file_path, 'rb') as file:
+        file.seek(start)
+        data = file.read(end - start)
+    # newline=None gives the same universal-newline handling as open(file_path, 'r')
+    lines = (line.strip() for line in io.StringIO(data.decode(encoding), newline=None))
+    return mapper(lines)
+
+def map_reduce_file(file_path: str, mapper, reducer, *, workers: Optional[int] = None,
+                    chunk_size: int = 16 * 1024 * 1024, encoding: Optional[str] = None):
+    """Run mapper(lines) over newline-aligned chunks of a file in parallel, combine with reducer.
+
+    mapper sees exactly the lines read_large_file() would yield (stripped str), one chunk at a time.
+    Partial results are reduced in file order, so the reducer doesn't need to be commutative.
+    mapper and reducer must be picklable (plain module-level functions, not lambdas).
+    """
+    from concurrent.futures import ProcessPoolExecutor  # imported here: see the note on lazy imports below
+
+    encoding = encoding or locale.getpreferredencoding(False)  # what open() uses by default
+    ranges = _line_aligned_ranges(file_path, chunk_size)
+    if not ranges:
+        return mapper(iter(()))
+
+    starts, ends = zip(*ranges)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        partials = pool.map(
+            _map_range,
+            itertools.repeat(file_path), starts, ends,
+            itertools.repeat(mapper), itertools.repeat(encoding),
+        )
+        return functools.reduce(reducer, partials)
+
+# Example: count the lines that mention an error.
+
+import operator
+
+def count_errors(lines) -> int:
+    return sum(1 for line in lines if "ERROR" in line)
+
+# total = map_reduce_file('large_text_file.txt', count_errors, operator.add)
+# ^ same answer as count_errors(read_large_file('large_text_file.txt')), just on all cores
+
+# Many small chunks (rather than one per worker) keep every worker busy until the very end
+#      and cap how much of the file a single worker holds in memory at once.
+
+# --------------------------------------------------------
+# 🌊 Async Generators: Reading Files Without Blocking the Event Loop
+# --------------------------------------------------------
+
+# Inside asyncio code, a plain `for line in read_large_file(...)` blocks the whole event loop
+#      until the file is done — every other task just sits there waiting.
+
+# An async generator (async def + yield) can hand the blocking reads to a thread pool in big chunks,
+#      and a bounded queue in between gives us backpressure: if the consumer is slow,
+#      the reader simply stops reading ahead once `prefetch` chunks are waiting.
+
+# A note on lazy imports: asyncio, multiprocessing and concurrent.futures together take ~35 ms to import.
+#      Importing them inside the functions that need them means code that only wants read_large_file()
+#      never pays for them. After the first call, an import is just a dictionary lookup.
+
+_EOF = object()  # sentinel: the reader is done
+
+def _read_stripped_lines(file, chunk_size: int) -> list:
+    # readlines(hint) stops at the first line boundary after ~chunk_size characters.
+    # Stripping happens here too, in the worker thread, not on the event loop.
+    return [line.strip() for line in file.readlines(chunk_size)]
+
+async def _read_chunks(file_path: str, queue: "asyncio.Queue", chunk_size: int, executor) -> None:
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    try:
+        file = await loop.run_in_executor(executor, open, file_path, 'r')
+        try:
+            while True:
+                lines = await loop.run_in_executor(executor, _read_stripped_lines, file, chunk_size)
+                if not lines:
+                    break
+                await queue.put(lines)  # waits while the queue is full
+        finally:
+            await loop.run_in_executor(executor, file.close)
+        await queue.put(_EOF)
+    except Exception as error:
+        await queue.put(error)
+
+async def aread_large_file(file_path: str, *, chunk_size: int = 1024 * 1024, prefetch: int = 4,
+                           yield_every: int = 256, executor=None):
+    """Async version of read_large_file(): `async for line in aread_large_file(path)`.
+
+    The file is read in ~chunk_size pieces on `executor` (default: the loop's thread pool),
+    with at most `prefetch` chunks read ahead of the consumer. Control goes back to the event loop
+    every `yield_every` lines, so hundreds of concurrent readers can't starve other tasks.
+    """
+    import asyncio
+
+    queue = asyncio.Queue(maxsize=prefetch)
+    reader = asyncio.create_task(_read_chunks(file_path, queue, chunk_size, executor))
+    try:
+        while True:
+            chunk = await queue.get()
+            if chunk is _EOF:
+                break
+            if isinstance(chunk, Exception):
+                raise chunk
+            for start in range(0, len(chunk), yield_every):
+                for line in chunk[start:start + yield_every]:
+                    yield line
+                # A ready queue (or a big chunk) never suspends us on its own,
+                #      so every `yield_every` lines we explicitly let other tasks run.
+                await asyncio.sleep(0)
+    finally:
+        reader.cancel()  # the consumer may stop early (break / exception)
+
+# async def main():
+#     async for line in aread_large_file('large_text_file.txt'):
+#         ...
+#
+# Hundreds of files at once is just hundreds of tasks — they all share one thread pool:
+#     await asyncio.gather(*(count_lines(path) for path in paths))
+
+# --------------------------------------------------------
+# ⏱️ Measuring it: how long does the event loop stall?
+# --------------------------------------------------------
+
+# A "heartbeat" task asks to wake up every millisecond; how late it actually wakes up
+#      is how long something else was hogging the event loop.
+
+async def _heartbeat(interval: float, stalls: list) -> None:
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    while True:
+        before = loop.time()
+        await asyncio.sleep(interval)
+        stalls.append(loop.time() - before - interval)
+
+async def _measure_stall(make_work):
+    import asyncio
+
+    stalls = []
+    heartbeat = asyncio.create_task(_heartbeat(0.001, stalls))
+    await asyncio.sleep(0)  # let the heartbeat start ticking
+    start = time.perf_counter()
+    await make_work()
+    elapsed = time.perf_counter() - start
+    await asyncio.sleep(0.005)  # give the heartbeat a chance to report a stall it was stuck in
+    heartbeat.cancel()
+    return elapsed, max(stalls, default=0.0)
+
+async def _count_lines_sync(file_path: str) -> int:
+    return sum(1 for _ in read_large_file(file_path))  # ❌ blocks the loop
+
+async def _count_lines_async(file_path: str) -> int:
+    count = 0
+    async for _ in aread_large_file(file_path):
+        count += 1
+    return count
+
+async def _benchmark_event_loop_stall(file_path: str, many_files: list) -> None:
+    import asyncio
+
+    cases = {
+        "sync generator, 1 file": lambda: _count_lines_sync(file_path),
+        "async generator, 1 file": lambda: _count_lines_async(file_path),
+        f"sync generator, {len(many_files)} files": lambda: asyncio.gather(*map(_count_lines_sync, many_files)),
+        f"async generator, {len(many_files)} files": lambda: asyncio.gather(*map(_count_lines_async, many_files)),
+    }
+    for label, work in cases.items():
+        elapsed, worst_stall = await _measure_stall(work)
+        print(f"{label:<28} total {elapsed:7.3f}s   worst event-loop stall {worst_stall * 1000:9.2f} ms")
+
+def benchmark_event_loop_stall(file_path: str, many_files: list) -> None:
+    import asyncio
+
+    asyncio.run(_benchmark_event_loop_stall(file_path, many_files))
+
 # --------------------------------------------------------
 # ✅ Key Takeaways:
 # --------------------------------------------------------
@@ -142,3 +447,51 @@ def read_large_file(file_path: str):
 # - They are useful for processing large data sets or infinite sequences.
 # - Use the 'yield' keyword to create generators in Python.
 # - Use itertools and generator expressions for concise, efficient code.
+
+# --------------------------------------------------------
+# Only runs when this file is run as a script (see 08_a_polite_suggestion.py)
+# --------------------------------------------------------
+
+if __name__ == "__main__":
+    import tempfile
+
+    with tempfile.NamedTemporaryFile('w', suffix='.log', delete=False) as sample:
+        for i in range(2_000_000):
+            level = "ERROR" if i % 50 == 0 else "INFO"
+            sample.write(f"2024-01-01 12:00:00 {level} request {i} handled in {i % 97} ms\n")
+    try:
+        benchmark_read_large_file(sample.name)
+
+        # Tiny chunks, blank lines and Windows line endings: still exactly the serial lines.
+        with tempfile.NamedTemporaryFile('wb', delete=False) as tricky:
+            tricky.write(b"  first \r\n\nsecond\n\r\n third\tline\nno newline at the end")
+        try:
+            assert map_reduce_file(tricky.name, list, operator.add, chunk_size=3) == list(read_large_file(tricky.name))
+        finally:
+            os.remove(tricky.name)
+
+        start = time.perf_counter()
+        serial = count_errors(read_large_file(sample.name))
+        serial_time = time.perf_counter() - start
+        for workers in (1, 2, 4, 8, 16, 32):
+            if workers > (os.cpu_count() or 1):
+                break
+            start = time.perf_counter()
+            parallel = map_reduce_file(sample.name, count_errors, operator.add,
+                                       workers=workers, chunk_size=4 * 1024 * 1024)
+            elapsed = time.perf_counter() - start
+            assert parallel == serial, (parallel, serial)
+            print(f"map_reduce_file workers={workers:<3} {elapsed:.3f}s   (serial generator {serial_time:.3f}s)")
+
+        many_files = []
+        for _ in range(200):
+            with tempfile.NamedTemporaryFile('w', suffix='.log', delete=False) as small:
+                small.writelines(f"line {i}\n" for i in range(20_000))
+            many_files.append(small.name)
+        try:
+            benchmark_event_loop_stall(sample.name, many_files)
+        finally:
+            for path in many_files:
+                os.remove(path)
+    finally:
+        os.remove(sample.name)
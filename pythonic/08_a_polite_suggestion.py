@@ -57,10 +57,114 @@ def greet(name):
 #     _hello("you")                         # Will print just fine.
 # -----------------------------------------------
 
+# -----------------------------------------------
+# GOING FURTHER: GREETING A MILLION PEOPLE
+# -----------------------------------------------
+# Because callers only ever see greet(), we're free to change *how* greetings are built.
+# _hello() builds one brand new string per name. When we greet millions of users and write
+#     them all to a file anyway, we can parse the greeting format once and skip the per-name strings:
+#     for "Hello, {name}!" a whole batch of names is just "!\nHello, ".join(names), wrapped in the first
+#     "Hello, " and the last "!\n" — one str.join per batch, handed to the file via writelines().
+
+import itertools
+
+class GreetingTemplate:
+    """A greeting format like "Hello, {name}!", parsed once and rendered many times."""
+
+    def __init__(self, template="Hello, {name}!"):
+        self.template = template
+        self._literals = _split_on_name(template)  # None if the template needs real formatting
+
+    def render(self, name):
+        if self._literals is None:
+            return self.template.format(name=name)
+        return str(name).join(self._literals)  # str(): any object works, like the f-string in _hello()
+
+    def render_many(self, names, sink, *, batch_size=65536):
+        """Write one greeting per line for every name to sink (io.StringIO, an open file ...)."""
+        if self._literals is None:  # {name!r}, {name:>10} etc.: fall back to one string per name
+            sink.writelines(f"{self.template.format(name=name)}\n" for name in names)
+            return
+
+        if len(self._literals) == 2:  # the usual case: {name} shows up once
+            head, tail = self._literals[0], self._literals[1] + "\n"
+            separator = tail + head
+            names = iter(names)
+            batches = iter(lambda: list(itertools.islice(names, batch_size)), [])
+            sink.writelines(head + separator.join(map(str, batch)) + tail for batch in batches)
+            return
+
+        *literals, last = self._literals
+        columns = []
+        for literal, names_copy in zip(literals, itertools.tee(names, len(literals))):
+            columns += [itertools.repeat(literal), map(str, names_copy)]
+        columns.append(itertools.repeat(last + "\n"))
+        # zip(...) gives ("Hello, ", name, "!\n") per name, chain flattens them: all in C, nothing joined
+        sink.writelines(itertools.chain.from_iterable(zip(*columns)))
+
+def _split_on_name(template):
+    """"Hi {name}, bye {name}" -> ["Hi ", ", bye ", ""]; None if it has anything but plain {name} fields."""
+    import string  # imported here, so importing this lesson stays cheap
+
+    literals = [""]
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        literals[-1] += literal
+        if field is None:
+            continue
+        if field != "name" or spec or conversion:
+            return None
+        literals.append("")
+    return literals if len(literals) > 1 else None
+
+# greetings = GreetingTemplate("Hello, {name}!")
+# with open("greetings.txt", "w") as out:
+#     greetings.render_many(all_user_names, out)
+
+def benchmark_greetings(count=1_000_000):
+    import io
+    import time
+
+    names = [f"user{i}" for i in range(count)]
+    template = GreetingTemplate("Hello, {name}!")
+
+    def with_hello():
+        out = io.StringIO()
+        for name in names:
+            out.write(_hello(name) + "\n")
+        return out
+
+    def with_print():
+        out = io.StringIO()
+        for name in names:
+            print(_hello(name), file=out)  # what greet() does, minus the terminal
+        return out
+
+    def with_template():
+        out = io.StringIO()
+        template.render_many(names, out)
+        return out
+
+    expected = with_hello().getvalue()
+    for label, render in (("print(_hello(name))", with_print), ("write(_hello(name))", with_hello),
+                          ("GreetingTemplate.render_many", with_template)):
+        start = time.perf_counter()
+        out = render()
+        elapsed = time.perf_counter() - start
+        assert out.getvalue() == expected
+        print(f"{label:<30} {count / elapsed:>14,.0f} names/sec")
+
+    # Names don't have to be strings, same as with _hello()
+    for template_text in ("Hello, {name}!", "{name} and {name}", "Hello, {name!r}!"):
+        out = io.StringIO()
+        GreetingTemplate(template_text).render_many([42, None], out)
+        assert out.getvalue() == "".join(template_text.format(name=name) + "\n" for name in (42, None))
+    assert template.render(42) == _hello(42)
+
 # This is a standard pattern for testing modules directly.
 # Only runs when this file is run as a script.
 if __name__ == "__main__":
     greet("Adrian")
+    benchmark_greetings()
 
 # -----------------------------------------------
 # TL;DR:
@@ -0,0 +1,263 @@
+# --------------------------------------------------------
+# ⏱️ Benchmarks: Do the ✅ Idioms Really Beat the ❌ Ones?
+# --------------------------------------------------------
+
+# The lessons say things like "faster lookup" or "more efficient" — this file actually measures them.
+# Every ❌/✅ pair from the lessons is timed the same way:
+# - a few warmup runs first (caches, branch predictors, the specializing interpreter in 3.11+ ...)
+# - then many repeated runs, so we get a mean *and* a 95% confidence interval, not one lucky number
+# - results go to JSON, so runs on different Python versions can be compared later
+
+# Run it:
+#     python -m pythonic.bench                       # everything, printed as a table
+#     python -m pythonic.bench -o results.json       # ...and saved as JSON
+#     python -m pythonic.bench -k swap --repeat 50   # only the pairs matching "swap"
+#     python -m pythonic.bench --imports             # what importing each lesson costs
+
+import argparse
+import datetime
+import json
+import math
+import platform
+import os
+import statistics
+import subprocess
+import sys
+import timeit
+from dataclasses import asdict, dataclass
+
+# --------------------------------------------------------
+# 🧪 The pairs (❌ anti-pattern vs ✅ idiom)
+# --------------------------------------------------------
+
+# Each variant is a timeit statement; `setup` runs once before timing, like in the lessons.
+
+@dataclass(frozen=True)
+class Pair:
+    name: str
+    lesson: str
+    setup: str
+    anti_pattern: str
+    idiom: str
+
+PAIRS = [
+    Pair(
+        name="range(len) vs enumerate",
+        lesson="02_idioms_and_antipatterns.py",
+        setup="fruits = ['apple', 'banana', 'cherry'] * 100",
+        anti_pattern="for i in range(len(fruits)):\n    fruit = fruits[i]",
+        idiom="for i, fruit in enumerate(fruits):\n    pass",
+    ),
+    Pair(
+        name="len() > 0 vs truthiness",
+        lesson="02_idioms_and_antipatterns.py",
+        setup="fruits = ['apple', 'banana', 'cherry']",
+        anti_pattern="if len(fruits) > 0:\n    pass",
+        idiom="if fruits:\n    pass",
+    ),
+    Pair(
+        name="temp swap vs tuple swap",
+        lesson="02_idioms_and_antipatterns.py",
+        setup="a = 1\nb = 2",
+        anti_pattern="temp = a\na = b\nb = temp",
+        idiom="a, b = b, a",
+    ),
+    Pair(
+        name="append loop vs comprehension",
+        lesson="00_introduction__.py, 02_idioms_and_antipatterns.py",
+        setup="numbers = list(range(100))",
+        anti_pattern="squares = []\nfor num in numbers:\n    squares.append(num ** 2)",
+        idiom="squares = [num ** 2 for num in numbers]",
+    ),
+    Pair(
+        name="if-chain vs dict",
+        lesson="02_idioms_and_antipatterns.py",
+        setup="status = 500\nmessages = {200: 'OK', 404: 'Not Found', 500: 'Server Error'}",
+        anti_pattern=(
+            "if status == 200:\n    message = 'OK'\n"
+            "elif status == 404:\n    message = 'Not Found'\n"
+            "elif status == 500:\n    message = 'Server Error'\n"
+            "else:\n    message = 'N/A'"
+        ),
+        idiom="message = messages.get(status, 'N/A')",
+    ),
+    Pair(
+        name="list vs set membership",
+        lesson="04_builtin_types.py",
+        setup="items = list(range(1000))\nunique = set(items)",
+        anti_pattern="999 in items",
+        idiom="999 in unique",
+    ),
+]
+
+# --------------------------------------------------------
+# 📐 Timing with confidence intervals
+# --------------------------------------------------------
+
+# Two-sided 95% Student's t critical values by degrees of freedom; above 30 the normal 1.96 is close enough.
+_T_95 = {
+    1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365, 8: 2.306, 9: 2.262, 10: 2.228,
+    11: 2.201, 12: 2.179, 13: 2.160, 14: 2.145, 15: 2.131, 16: 2.120, 17: 2.110, 18: 2.101, 19: 2.093,
+    20: 2.086, 21: 2.080, 22: 2.074, 23: 2.069, 24: 2.064, 25: 2.060, 26: 2.056, 27: 2.052, 28: 2.048,
+    29: 2.045, 30: 2.042,
+}
+
+@dataclass
+class Result:
+    pair: str
+    lesson: str
+    variant: str   # "anti_pattern" or "idiom"
+    loops: int     # statement executions per run
+    runs: int
+    mean_ns: float  # per statement execution
+    stdev_ns: float
+    ci95_low_ns: float
+    ci95_high_ns: float
+
+def measure(stmt, setup, *, repeat=30, warmup=3, min_run_time=0.02):
+    """Return (loops, per-execution times in ns) for `repeat` timed runs after `warmup` runs."""
+    timer = timeit.Timer(stmt, setup)
+    loops, elapsed = timer.autorange()  # finds a loop count that takes at least 0.2s
+    loops = max(1, int(loops * min_run_time / elapsed))  # ...then scale it down to ~min_run_time per run
+    timer.repeat(repeat=warmup, number=loops)
+    return loops, [total / loops * 1e9 for total in timer.repeat(repeat=repeat, number=loops)]
+
+def summarize(pair, variant, loops, samples):
+    mean = statistics.fmean(samples)
+    stdev = statistics.stdev(samples) if len(samples) > 1 else 0.0
+    margin = _T_95.get(len(samples) - 1, 1.96) * stdev / math.sqrt(len(samples))
+    return Result(pair.name, pair.lesson, variant, loops, len(samples), mean, stdev, mean - margin, mean + margin)
+
+def run(pairs=PAIRS, *, repeat=30, warmup=3):
+    results = []
+    for pair in pairs:
+        for variant in ("anti_pattern", "idiom"):
+            loops, samples = measure(getattr(pair, variant), pair.setup, repeat=repeat, warmup=warmup)
+            results.append(summarize(pair, variant, loops, samples))
+    return results
+
+def environment():
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+    }
+
+# --------------------------------------------------------
+# 🚀 Import cost of each lesson
+# --------------------------------------------------------
+
+# Importing a lesson should only define things — no printing, no files, no heavy libraries.
+# Each lesson is loaded in a fresh interpreter under `python -X importtime`, which logs
+#      every import it triggers; we keep only what happens after our marker line.
+
+LESSONS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+_IMPORT_PROBE = '''
+import importlib.util, sys, time
+spec = importlib.util.spec_from_file_location("lesson", sys.argv[1])
+module = importlib.util.module_from_spec(spec)
+sys.stderr.write("--- lesson starts here ---\\n")
+start = time.perf_counter()
+spec.loader.exec_module(module)
+print(time.perf_counter() - start)
+'''
+
+@dataclass
+class ImportCost:
+    lesson: str
+    load_ms: float    # executing the lesson, including its imports
+    imports_ms: float  # just the (not yet cached) modules it imported
+    printed: bool      # did importing it write to stdout?
+    heaviest: list     # [(module, ms), ...] top-level imports, most expensive first
+
+def lesson_files():
+    return sorted(name for name in os.listdir(LESSONS_DIR) if name[:2].isdigit() and name.endswith(".py"))
+
+def import_cost(lesson):
+    probe = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _IMPORT_PROBE, os.path.join(LESSONS_DIR, lesson)],
+        capture_output=True, text=True, check=True,
+    )
+    *printed, load_seconds = probe.stdout.splitlines()
+    _, _, log = probe.stderr.partition("--- lesson starts here ---\n")
+
+    top_level = []
+    for line in log.splitlines():
+        # "import time:  self [us] | cumulative | package"; nested imports are indented further
+        if not line.startswith("import time:") or line.endswith("imported package"):
+            continue
+        _, cumulative, name = line.split("|")
+        if not name.startswith("  "):
+            top_level.append((name.strip(), int(cumulative) / 1000))
+    top_level.sort(key=lambda item: item[1], reverse=True)
+    return ImportCost(lesson, float(load_seconds) * 1000, sum(ms for _, ms in top_level), bool(printed), top_level[:3])
+
+def print_import_costs(costs):
+    for cost in costs:
+        heaviest = ", ".join(f"{name} {ms:.1f}" for name, ms in cost.heaviest) or "-"
+        side_effects = "  ⚠️ prints on import" if cost.printed else ""
+        print(f"{cost.lesson:<48} {cost.load_ms:>8.2f} ms   imports {cost.imports_ms:>7.2f} ms ({heaviest}){side_effects}")
+
+# --------------------------------------------------------
+# 🖨️ Reporting
+# --------------------------------------------------------
+
+def print_table(results):
+    by_pair = {}
+    for result in results:
+        by_pair.setdefault(result.pair, {})[result.variant] = result
+
+    for name, variants in by_pair.items():
+        anti, idiom = variants["anti_pattern"], variants["idiom"]
+        # Only call it a win when the confidence intervals don't overlap
+        if idiom.ci95_high_ns < anti.ci95_low_ns:
+            verdict = f"✅ {anti.mean_ns / idiom.mean_ns:.2f}x faster"
+        elif anti.ci95_high_ns < idiom.ci95_low_ns:
+            verdict = f"❌ {idiom.mean_ns / anti.mean_ns:.2f}x slower"
+        else:
+            verdict = "≈ no measurable difference"
+        print(f"{name:<32}"
+              f" ❌ {anti.mean_ns:>10,.1f} ns ±{anti.mean_ns - anti.ci95_low_ns:>7,.1f}"
+              f"   ✅ {idiom.mean_ns:>10,.1f} ns ±{idiom.mean_ns - idiom.ci95_low_ns:>7,.1f}"
+              f"   {verdict}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m pythonic.bench",
+                                     description="Time every ❌/✅ pair from the lessons.")
+    parser.add_argument("-k", dest="keyword", default="", help="only run pairs whose name contains this")
+    parser.add_argument("--repeat", type=int, default=30, help="timed runs per variant (default: 30)")
+    parser.add_argument("--warmup", type=int, default=3, help="untimed runs per variant first (default: 3)")
+    parser.add_argument("-o", "--output", help="write the results as JSON to this file ('-' for stdout)")
+    parser.add_argument("--imports", action="store_true", help="measure the import cost of each lesson instead")
+    args = parser.parse_args(argv)
+
+    if args.imports:
+        costs = [import_cost(lesson) for lesson in lesson_files()]
+        if args.output != "-":
+            print_import_costs(costs)
+        if args.output:
+            _write_json({"environment": environment(), "imports": [asdict(cost) for cost in costs]}, args.output)
+        return
+
+    pairs = [pair for pair in PAIRS if args.keyword.lower() in pair.name.lower()]
+    if not pairs:
+        parser.error(f"no pair matches {args.keyword!r}")
+
+    results = run(pairs, repeat=args.repeat, warmup=args.warmup)
+    if args.output != "-":
+        print_table(results)
+    if args.output:
+        _write_json({"environment": environment(), "results": [asdict(result) for result in results]}, args.output)
+
+def _write_json(report, output):
+    if output == "-":
+        json.dump(report, sys.stdout, indent=2)
+    else:
+        with open(output, "w") as file:
+            json.dump(report, file, indent=2)
+
+if __name__ == "__main__":
+    main()